@@ -12,10 +12,12 @@
 # SENZING_GOVERNOR_POSTGRESQL_LOW_WATERMARK.
 # Once the XID age is below the "low watermark", the threads resume processing.
 #
-# XID age is reduced with the Postgres vacuum command. This example doesn't
-# attempt to issue the vacuum command.  The user running the Governor may not
+# XID age is reduced with the Postgres vacuum command. By default this example
+# doesn't attempt to issue the vacuum command.  The user running the Governor may not
 # have the privileges to do so. When the age threshold is detected, a manual step
 # of issuing the postgres vacuum command is required.
+# With SENZING_GOVERNOR_VACUUM_ADVISORY, the oldest relations are listed, and with
+# SENZING_GOVERNOR_VACUUM_FREEZE, those the user may vacuum are frozen in the background.
 # Reference: https://www.postgresql.org/docs/current/sql-vacuum.html
 #
 # This example uses the native Python Postgres driver psycopg2.
@@ -23,41 +25,1103 @@
 # --------------------------------------------------------------------------------------------------------------
 
 # Import from standard library. https://docs.python.org/3/library/
-
+#  - asyncio, concurrent.futures, http.server, logging.handlers, multiprocessing.shared_memory, queue, signal,
+#    socket and socketserver are imported by the code that uses them, to keep "import senzing_governor" fast.
+
+import atexit
+import bisect
+import collections
+import contextvars
+import functools
+import itertools
 import json
 import logging
+import math
 import os
 import re
 import string
+import struct
+import sys
 import threading
 import time
 import urllib.parse
 from urllib.parse import parse_qs, urlparse
 
-import psycopg2
-
 # Import from https://pypi.org/
+#  - psycopg2 is imported when the first connection is made, to keep "import senzing_governor" fast.
 
 
 # Metadata
 
 __all__ = []
-__version__ = "1.0.10"  # See https://www.python.org/dev/peps/pep-0396/
+__version__ = "1.1.0"  # See https://www.python.org/dev/peps/pep-0396/
 __date__ = "2020-08-26"
-__updated__ = "2023-10-05"
+__updated__ = "2026-10-17"
 
 # See https://github.com/Senzing/knowledge-base/blob/main/lists/senzing-product-ids.md
 SENZING_PRODUCT_ID = "5017"
 log_format = "%(asctime)s %(message)s"
 
+# Governor messages go to this logger.  It propagates to the root logger unless configure_logging() says otherwise.
+
+logger = logging.getLogger("senzing_governor")
+log_listener = None
+log_listener_lock = threading.Lock()
+LOG_FORMATS = ["text", "json"]
+
 # Lists from https://www.ietf.org/rfc/rfc1738.txt
 
 safe_character_list = ["$", "-", "_", ".", "+", "!", "*", "(", ")", ",", '"'] + list(string.ascii_letters)
 unsafe_character_list = ['"', "<", ">", "#", "%", "{", "}", "|", "\\", "^", "~", "[", "]", "`"]
 reserved_character_list = [";", ",", "/", "?", ":", "@", "=", "&"]
 
+# An immutable view of the most recent database check.
+# Published as a whole so readers never see a half-updated result.
+
+GovernorSnapshot = collections.namedtuple(
+    "GovernorSnapshot", ["wait_time", "watermark", "oid_name", "database_name", "sample_time"]
+)
+
+# One govern() call as recorded by the profiler.  Times are in seconds.
+# "wait_time" is the time spent deciding the wait time, excluding logging.
+
+ProfileRecord = collections.namedtuple(
+    "ProfileRecord", ["timestamp", "thread", "total", "lock", "probe", "wait_time", "logging"]
+)
+
+# Phase timings of the govern() call in progress, per thread (or asyncio task).
+
+profile_phases = contextvars.ContextVar("senzing_governor_profile_phases", default=None)
+
+
+class WaitTime(float):
+    """
+    A wait time in seconds, as returned by govern().  Being a float, it can be given straight to time.sleep().
+    "database" names the database that caused it, or is None when no database asks for a wait.
+    """
+
+    def __new__(cls, wait_time, database=None):
+        result = super().__new__(cls, wait_time)
+        result.database = database
+        return result
+
+
+def worse_wait_time(wait_time, other_wait_time):
+    """The more restrictive of two wait times: -1.0 beats any wait, otherwise the longer wait.  Ties keep the first."""
+
+    if wait_time < 0 or wait_time >= other_wait_time >= 0:
+        return wait_time
+    return other_wait_time
+
+
+# -----------------------------------------------------------------------------
+# Logging
+# -----------------------------------------------------------------------------
+
+
+class JsonLogFormatter(logging.Formatter):
+    """
+    One JSON object per message: "time" (epoch seconds), "level", "id" (e.g. "senzing-50170005I"),
+    "message" and, for messages logged through Governor.log_info() and log_warning(), the raw "args".
+    """
+
+    def format(self, record):
+        message = record.getMessage()
+        event = {
+            "time": record.created,
+            "level": record.levelname,
+            "id": message.split(" ", 1)[0] if message.startswith("senzing-") else None,
+            "message": message,
+        }
+        args = getattr(record, "governor_args", None)
+        if args is not None:
+            event["args"] = list(args)
+        if record.exc_info:
+            event["exception"] = self.formatException(record.exc_info)
+        return json.dumps(event, default=str)
+
+
+def configure_logging(log_queue=False, log_format="text"):
+    """
+    Decide how the "senzing_governor" logger writes, for the whole process.
+    With log_format "json", messages are written to stderr by a JsonLogFormatter instead of the root logger's handlers.
+    With log_queue, the handlers run on a QueueListener thread, so a slow handler never holds up the caller.
+    Each call replaces the previous configuration; configure_logging() restores the default.
+    """
+
+    import logging.handlers  # pylint: disable=import-outside-toplevel
+    import queue  # pylint: disable=import-outside-toplevel
+
+    global log_listener  # pylint: disable=global-statement
+
+    if log_format not in LOG_FORMATS:
+        raise ValueError("log_format of {0} is not one of {1}.".format(log_format, LOG_FORMATS))
+    with log_listener_lock:
+        if log_listener is not None:
+            log_listener.stop()
+            log_listener = None
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.propagate = True
+        if not log_queue and log_format == "text":
+            return
+
+        if log_format == "json":
+            handler = logging.StreamHandler()
+            handler.setFormatter(JsonLogFormatter())
+            handlers = [handler]
+        else:
+            handlers = logging.getLogger().handlers or [logging.lastResort]
+        if log_queue:
+            records = queue.SimpleQueue()
+            log_listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+            log_listener.start()
+            handlers = [logging.handlers.QueueHandler(records)]
+        for handler in handlers:
+            logger.addHandler(handler)
+        logger.propagate = False
+
+
+def stop_log_listener():
+    """Write out what is still queued.  Registered with atexit."""
+
+    global log_listener  # pylint: disable=global-statement
+
+    with log_listener_lock:
+        if log_listener is not None:
+            log_listener.stop()
+            log_listener = None
+
+
+atexit.register(stop_log_listener)
+
+
+# -----------------------------------------------------------------------------
+# Utility functions
+# -----------------------------------------------------------------------------
+
+
+def import_numpy():
+    """numpy is optional.  It is only imported when a batch of wait times is evaluated."""
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        return numpy
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def compile_format_string(format_string):
+    """
+    Turn a str.format() style format string into a compiled regular expression with a named group per field.
+    Returns (pattern, keywords).  Results are cached, so each format string is only compiled once.
+    """
+
+    # First split on any keyword arguments, note that the names of keyword arguments will be in the
+    # 1st, 3rd, ... positions in this list
+
+    tokens = re.split(r"\{(.*?)\}", format_string)
+    keywords = tokens[1::2]
+
+    # Now replace keyword arguments with named groups matching them. We also escape between keyword
+    # arguments so we support meta-characters there. Re-join tokens to form our regexp pattern
+
+    tokens[1::2] = map("(?P<{}>.*)".format, keywords)
+    tokens[0::2] = map(re.escape, tokens[0::2])
+    return re.compile("".join(tokens)), tuple(keywords)
+
+
+def str_to_bool(value):
+    """Interpret booleans given as strings, e.g. from environment variables."""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ["1", "true", "t", "yes", "y", "on"]
+
+
+# -----------------------------------------------------------------------------
+# Class: SharedSnapshot
+# -----------------------------------------------------------------------------
+
+
+class SharedSnapshot:
+    """
+    A GovernorSnapshot kept in a multiprocessing.shared_memory segment.
+    One publisher writes; any number of processes read without locks.
+    A sequence number that is odd while a write is in progress lets readers
+    detect, and retry, a torn read.
+    """
+
+    # sequence, wait_time, watermark, sample_time, database_name, oid_name
+
+    struct_format = "<Qdqd64s64s"
+    payload_format = "<dqd64s64s"
+    size = struct.calcsize(struct_format)
+
+    # Names of segments created by this process; the resource tracker already owns them.
+
+    created_names = set()
+
+    def __init__(self, name, create=False):
+        from multiprocessing import (  # pylint: disable=import-outside-toplevel
+            shared_memory,
+        )
+
+        self.name = name
+        self.create = create
+        if create:
+            try:
+                self.shared_memory = shared_memory.SharedMemory(name=name, create=True, size=self.size)
+                SharedSnapshot.created_names.add(name)
+            except FileExistsError:
+                self.shared_memory = self.attach(name)
+            struct.pack_into(self.struct_format, self.shared_memory.buf, 0, 0, 0.0, 0, 0.0, b"", b"")
+        else:
+            self.shared_memory = self.attach(name)
+
+    @staticmethod
+    def attach(name):
+        """Attach to an existing segment without letting this process's resource tracker unlink it."""
+
+        from multiprocessing import (  # pylint: disable=import-outside-toplevel
+            resource_tracker,
+            shared_memory,
+        )
+
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)  # pylint: disable=unexpected-keyword-arg
+        result = shared_memory.SharedMemory(name=name)
+        if name not in SharedSnapshot.created_names:
+            resource_tracker.unregister(result._name, "shared_memory")  # pylint: disable=protected-access
+        return result
+
+    def sequence(self):
+        return struct.unpack_from("<Q", self.shared_memory.buf, 0)[0]
+
+    def write(self, snapshot):
+        buf = self.shared_memory.buf
+        sequence = self.sequence()
+        struct.pack_into("<Q", buf, 0, sequence + 1)
+        struct.pack_into(
+            self.payload_format,
+            buf,
+            8,
+            snapshot.wait_time,
+            snapshot.watermark,
+            snapshot.sample_time,
+            str(snapshot.database_name or "").encode("utf-8")[:64],
+            str(snapshot.oid_name or "").encode("utf-8")[:64],
+        )
+        struct.pack_into("<Q", buf, 0, sequence + 2)
+
+    def read(self, max_attempts=1000):
+        """
+        Return (sequence, GovernorSnapshot) from a consistent read of the segment,
+        or None if none was had in max_attempts, e.g. because the publisher died in the middle of a write.
+        """
+
+        for _ in range(max_attempts):
+            sequence, wait_time, watermark, sample_time, database_name, oid_name = struct.unpack_from(
+                self.struct_format, self.shared_memory.buf, 0
+            )
+            if sequence % 2 == 0 and sequence == self.sequence():
+                return sequence, GovernorSnapshot(
+                    wait_time,
+                    watermark,
+                    oid_name.rstrip(b"\0").decode("utf-8") or None,
+                    database_name.rstrip(b"\0").decode("utf-8") or None,
+                    sample_time,
+                )
+        return None
+
+    def close(self):
+        self.shared_memory.close()
+        if self.create:
+            SharedSnapshot.created_names.discard(self.name)
+            try:
+                self.shared_memory.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# -----------------------------------------------------------------------------
+# Probe connections shared within a process
+# -----------------------------------------------------------------------------
+
+
+class SharedConnection:
+    """
+    One probe connection per database URL, shared by every Governor in the process.
+    Each user gets its own cursor; psycopg2 serializes the queries on the connection.
+    close() gives up one user's share.  The connection is closed when nobody uses it.
+    A connection found closed or broken is replaced for new users.
+    """
+
+    pool = {}
+    pool_lock = threading.Lock()
+
+    def __init__(self, key, connection):
+        self.connection = connection
+        self.key = key
+        self.users = 0
+
+    @classmethod
+    def acquire(cls, key, connect):
+        with cls.pool_lock:
+            shared = cls.pool.get(key)
+            if shared is None or shared.connection.closed:
+                shared = cls.pool[key] = cls(key, connect())
+            shared.users += 1
+            return shared
+
+    def cursor(self):
+        return self.connection.cursor()
+
+    def close(self):
+        with self.pool_lock:
+            self.users -= 1
+            if self.users > 0:
+                return
+            if self.pool.get(self.key) is self:
+                del self.pool[self.key]
+        self.connection.close()
+
+
+# -----------------------------------------------------------------------------
+# Wait time strategies
+# -----------------------------------------------------------------------------
+
+
+class WaitStrategy:
+    """
+    Maps a watermark ratio to a wait time in seconds.
+    The ratio is 0.0 at the low watermark and 1.0 at the high watermark.
+    Above 1.0 the system is in trouble and -1.0 is returned.
+    Subclasses implement get_wait_time() and, for batch evaluation, get_wait_times().
+    """
+
+    def __init__(self, step_ratios=None):
+        self.set_step_ratios(step_ratios or [])
+
+    def set_step_ratios(self, step_ratios):
+        """
+        step_ratios is a list of (ratio, wait time), highest ratio first.
+        Every strategy takes its scale, the largest wait time, from it.
+        """
+
+        self.step_ratios = step_ratios
+        self.max_wait_time = max([step[1] for step in step_ratios] + [0.0])
+
+    def get_wait_time(self, watermark_ratio):
+        raise NotImplementedError()
+
+    def get_wait_times(self, watermark_ratios):
+        """
+        Evaluate many ratios in one call.
+        Returns a numpy array when numpy is installed, otherwise a list.
+        """
+
+        numpy = import_numpy()
+        if numpy is None:
+            return [self.get_wait_time(watermark_ratio) for watermark_ratio in watermark_ratios]
+        watermark_ratios = numpy.asarray(watermark_ratios, dtype=float)
+        result = self.get_wait_times_numpy(numpy, watermark_ratios)
+        return numpy.where(watermark_ratios > 1.0, -1.0, numpy.where(watermark_ratios <= 0.0, 0.0, result))
+
+    def get_wait_times_numpy(self, numpy, watermark_ratios):
+        return numpy.fromiter((self.get_wait_time(ratio) for ratio in watermark_ratios), float, len(watermark_ratios))
+
+
+class StepWaitStrategy(WaitStrategy):
+    """The wait time of the highest step whose ratio is exceeded, found by bisection."""
+
+    def set_step_ratios(self, step_ratios):
+        super().set_step_ratios(step_ratios)
+        ascending = sorted(step_ratios)
+        self.thresholds = [step[0] for step in ascending]
+        self.wait_times = [step[1] for step in ascending]
+
+    def get_wait_time(self, watermark_ratio):
+        index = bisect.bisect_left(self.thresholds, watermark_ratio) - 1
+        if index < 0:
+            return 0
+        return self.wait_times[index]
+
+    def get_wait_times(self, watermark_ratios):
+        numpy = import_numpy()
+        if numpy is None or not self.thresholds:
+            return super().get_wait_times(watermark_ratios)
+
+        # The step table itself decides the value above 1.0 and at or below 0.0.
+
+        indexes = numpy.searchsorted(self.thresholds, numpy.asarray(watermark_ratios, dtype=float), side="left") - 1
+        wait_times = numpy.asarray(self.wait_times, dtype=float)
+        return numpy.where(indexes < 0, 0.0, wait_times[numpy.maximum(indexes, 0)])
+
+
+class LinearWaitStrategy(WaitStrategy):
+    """Wait time grows in proportion to the ratio, reaching the largest step's wait at the high watermark."""
+
+    def get_wait_time(self, watermark_ratio):
+        if watermark_ratio > 1.0:
+            return -1.0
+        if watermark_ratio <= 0.0:
+            return 0.0
+        return watermark_ratio * self.max_wait_time
+
+    def get_wait_times_numpy(self, numpy, watermark_ratios):
+        return watermark_ratios * self.max_wait_time
+
+
+class ExponentialWaitStrategy(WaitStrategy):
+    """((1.1 ** percentage) - 1) / 100, capped at the largest step's wait."""
+
+    def get_wait_time(self, watermark_ratio):
+        if watermark_ratio > 1.0:
+            return -1.0
+        if watermark_ratio <= 0.0:
+            return 0.0
+        return min(((1.1 ** (watermark_ratio * 100)) - 1) / 100, self.max_wait_time)
+
+    def get_wait_times_numpy(self, numpy, watermark_ratios):
+        return numpy.minimum((numpy.power(1.1, watermark_ratios * 100) - 1) / 100, self.max_wait_time)
+
+
+class SmoothedStepWaitStrategy(WaitStrategy):
+    """Ramps linearly from each step's wait time to the next instead of jumping."""
+
+    def set_step_ratios(self, step_ratios):
+        super().set_step_ratios(step_ratios)
+        ascending = sorted(step for step in step_ratios if step[1] >= 0)
+        self.thresholds = [step[0] for step in ascending]
+        self.wait_times = [step[1] for step in ascending]
+
+    def get_wait_time(self, watermark_ratio):
+        if watermark_ratio > 1.0:
+            return -1.0
+        if watermark_ratio <= 0.0 or not self.thresholds:
+            return 0.0
+        index = bisect.bisect_right(self.thresholds, watermark_ratio) - 1
+        if index < 0:
+            return 0.0
+        if index >= len(self.thresholds) - 1:
+            return self.wait_times[-1]
+        low, high = self.thresholds[index], self.thresholds[index + 1]
+        fraction = (watermark_ratio - low) / (high - low)
+        return self.wait_times[index] + fraction * (self.wait_times[index + 1] - self.wait_times[index])
+
+    def get_wait_times_numpy(self, numpy, watermark_ratios):
+        if not self.thresholds:
+            return numpy.zeros_like(watermark_ratios)
+        return numpy.interp(watermark_ratios, self.thresholds, self.wait_times, left=0.0)
+
+
+WAIT_STRATEGIES = {
+    "exponential": ExponentialWaitStrategy,
+    "linear": LinearWaitStrategy,
+    "smoothed-step": SmoothedStepWaitStrategy,
+    "step": StepWaitStrategy,
+}
+
+
+# -----------------------------------------------------------------------------
+# Token bucket rate shaping
+# -----------------------------------------------------------------------------
+
+
+class TokenBucket:
+    """
+    Tokens refill at "rate" per second up to "capacity".
+    A caller may take more tokens than are available; the bucket goes into debt
+    and the caller is told how long to wait for the debt to be repaid.
+    Later callers queue up behind it, so callers are spaced out evenly.
+    """
+
+    def __init__(self, rate, capacity, now):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = now
+
+    def set_rate(self, rate, capacity, now):
+        """Refill at the old rate up to "now", then change the rate and capacity, keeping any debt."""
+
+        self.take(0, now)
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = min(self.tokens, capacity)
+
+    def take(self, cost, now):
+        """Take "cost" tokens.  Returns the seconds to wait before using them."""
+
+        self.tokens = min(self.tokens + ((now - self.updated) * self.rate), self.capacity)
+        self.updated = now
+        self.tokens -= cost
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class TokenBucketShaper:
+    """
+    Share a records/sec budget between priority classes, one TokenBucket each.
+    A class gets budget * weight / (sum of weights of the classes seen so far).
+    With no budget, callers are not limited.
+    """
+
+    def __init__(self, priorities, burst_in_seconds=1.0, max_wait_in_seconds=None):
+        self.budget = None
+        self.buckets = {}
+        self.burst_in_seconds = burst_in_seconds
+        self.lock = threading.Lock()
+        self.max_wait_in_seconds = max_wait_in_seconds
+        self.priorities = priorities
+
+    def set_budget(self, budget, now):
+        with self.lock:
+            self.budget = budget
+            if budget is None:
+                self.buckets.clear()
+            else:
+                self.rebalance(now)
+
+    def rebalance(self, now):
+        total_weight = sum(self.priorities.get(hint, 1.0) for hint in self.buckets)
+        for hint, bucket in self.buckets.items():
+            rate = max(self.budget * self.priorities.get(hint, 1.0) / total_weight, 1e-9)
+            bucket.set_rate(rate, rate * self.burst_in_seconds, now)
+
+    def take(self, cost, hint, now):
+        """Seconds for a caller of priority class "hint" to wait before processing "cost" records."""
+
+        if self.budget is None:
+            return 0.0
+        with self.lock:
+            if self.budget is None:
+                return 0.0
+            bucket = self.buckets.get(hint)
+            if bucket is None:
+                bucket = self.buckets[hint] = TokenBucket(self.budget, self.budget * self.burst_in_seconds, now)
+                self.rebalance(now)
+            wait_time = bucket.take(cost, now)
+        if self.max_wait_in_seconds is not None:
+            wait_time = min(wait_time, self.max_wait_in_seconds)
+        return wait_time
+
+
+def parse_priorities(priorities, list_separator=","):
+    """Parse "loader=4,redoer=1" into {"loader": 4.0, "redoer": 1.0}."""
+
+    if isinstance(priorities, dict):
+        return {hint: float(weight) for hint, weight in priorities.items()}
+    result = {}
+    for item in (priorities or "").split(list_separator):
+        if "=" in item:
+            hint, weight = item.split("=", 1)
+            result[hint.strip()] = float(weight)
+    return result
+
+
+# Settings that a SENZING_GOVERNOR_CONFIG_FILE may change while running.
+
+RELOADABLE_SETTINGS = [
+    "check_time_interval_in_seconds",
+    "database_urls",
+    "database_watermarks",
+    "high_watermark",
+    "interval",
+    "low_watermark",
+    "signal_watermarks",
+    "step_ratios",
+]
+
+# Signals read by the "signals" probe strategy, other than age(XID), and their default (low, high) watermarks.
+# "replay_lag" is in seconds; "wraparound_vacuums" is the number of anti-wraparound autovacuums running.
+
+SIGNAL_WATERMARKS = {
+    "multixact_age": (1_200_000_000, 1_500_000_000),
+    "replay_lag": (60, 600),
+    "wraparound_vacuums": (1, 3),
+}
+SIGNALS = ["multixact_age", "replay_lag", "wraparound_vacuums"]
+
+
+def parse_watermarks(watermarks, list_separator=","):
+    """
+    Parse "G2=1200000000:1500000000,G2_RES=1100000000:1400000000" into {"G2": (1200000000.0, 1500000000.0), ...}.
+    Names may be database URLs; only the last "=" separates the watermarks.
+    """
+
+    if isinstance(watermarks, dict):
+        items = watermarks.items()
+    else:
+        items = [item.rsplit("=", 1) for item in (watermarks or "").split(list_separator) if "=" in item]
+    result = {}
+    for name, low_and_high in items:
+        if isinstance(low_and_high, str):
+            low_and_high = low_and_high.split(":")
+        low_watermark, high_watermark = [float(watermark) for watermark in low_and_high]
+        result[name.strip()] = (low_watermark, high_watermark)
+    return result
+
+
+def parse_signal_watermarks(signal_watermarks, list_separator=",", log_warning=None):
+    """
+    Parse "multixact_age=1200000000:1500000000,replay_lag=60:600" like parse_watermarks().
+    Signals that are not given keep their defaults from SIGNAL_WATERMARKS.
+    Unknown signals are reported through log_warning(format_string, *args), by default logger.warning.
+    """
+
+    log_warning = log_warning or logger.warning
+    result = dict(SIGNAL_WATERMARKS)
+    for signal_name, watermarks in parse_watermarks(signal_watermarks, list_separator).items():
+        if signal_name not in SIGNALS:
+            log_warning(
+                "senzing-%s0714W SENZING_GOVERNOR_SIGNAL_WATERMARKS signal %s is not one of %s. Ignored.",
+                SENZING_PRODUCT_ID,
+                signal_name,
+                SIGNALS,
+            )
+            continue
+        result[signal_name] = watermarks
+    return result
+
 
-class Governor:
+# -----------------------------------------------------------------------------
+# Vacuum advisory
+# -----------------------------------------------------------------------------
+
+
+class VacuumAdvisor:
+    """
+    When a database is above the low watermark, rank its oldest relations and,
+    optionally, run VACUUM (FREEZE) on them one at a time from a separate connection.
+    The work is done by a single background thread, so govern() never waits for it.
+    Progress is read from pg_stat_progress_vacuum on the probe connection during checks;
+    AsyncGovernor reads it with poll_progress_async().
+
+    State is kept in each database_connection:
+      - "vacuum_future": the background job, if any.
+      - "vacuum_pid": backend PID of the vacuuming connection while VACUUM runs.
+      - "vacuum_relation": the relation being vacuumed.
+      - "vacuum_progress": the latest pg_stat_progress_vacuum reading.
+      - "vacuum_last_run": when the last job was started.
+    """
+
+    sql_stmt_rank = (
+        "SELECT c.oid::regclass, age(c.relfrozenxid), pg_total_relation_size(c.oid), "
+        "pg_has_role(c.relowner, 'USAGE') OR (SELECT rolsuper FROM pg_roles WHERE rolname = current_user) "
+        "FROM pg_class c JOIN pg_namespace n on c.relnamespace = n.oid "
+        "WHERE relkind IN ('r', 't', 'm') AND n.nspname NOT IN ('pg_toast') AND age(c.relfrozenxid) > %s "
+        "ORDER BY 2 DESC, 3 ASC LIMIT %s;"
+    )
+    sql_stmt_progress = (
+        "SELECT phase, heap_blks_total, heap_blks_scanned, heap_blks_vacuumed "
+        "FROM pg_stat_progress_vacuum WHERE pid = %s;"
+    )
+
+    def __init__(
+        self,
+        connect,
+        threshold,
+        freeze=False,
+        top_n=5,
+        cost_delay_in_milliseconds=2,
+        cost_limit=200,
+        min_interval_in_seconds=600,
+        clock=time.time,
+        log_info=None,
+    ):
+        self.clock = clock
+        self.connect = connect
+        self.log_info = log_info or logger.info
+        self.cost_delay_in_milliseconds = cost_delay_in_milliseconds
+        self.cost_limit = cost_limit
+        self.executor = None
+        self.freeze = freeze
+        self.min_interval_in_seconds = min_interval_in_seconds
+        self.threshold = threshold
+        self.top_n = top_n
+        self.worker_connections = set()
+
+    def observe(self, database_connection, cursor, watermark):
+        """
+        Called after each successful probe, on the thread that owns cursor.
+        Reports progress of a running VACUUM, or starts a new job when one is due.
+        """
+
+        import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+        future = database_connection.get("vacuum_future")
+        if future is not None and not future.done():
+            if cursor is not None and self.is_vacuuming(database_connection):
+                self.poll_progress(database_connection, cursor)
+            return
+        if watermark <= self.get_threshold(database_connection):
+            return
+        if self.clock() - database_connection.get("vacuum_last_run", -math.inf) < self.min_interval_in_seconds:
+            return
+        if self.executor is None:
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="senzing-governor-vacuum"
+            )
+        database_connection["vacuum_last_run"] = self.clock()
+        database_connection["vacuum_future"] = self.executor.submit(self.run, database_connection)
+
+    def get_threshold(self, database_connection):
+        """The age above which relations of a database are listed.  "threshold" is an age or a function returning one."""
+
+        if callable(self.threshold):
+            return self.threshold(database_connection)
+        return self.threshold
+
+    def rank_relations(self, cursor, threshold=None):
+        """Return [(relation, age, size in bytes, may vacuum)] for the oldest relations above the threshold."""
+
+        cursor.execute(self.sql_stmt_rank, (self.threshold if threshold is None else threshold, self.top_n))
+        return cursor.fetchall()
+
+    def run(self, database_connection):
+        database_name = database_connection.get("parsed_database_url", {}).get("dbname")
+        try:
+            connection = self.connect(database_connection.get("parsed_database_url"))
+        except Exception as err:
+            logger.warning(
+                "senzing-{0}0710W Governor vacuum advisory could not connect to {1} database. Error: {2}".format(
+                    SENZING_PRODUCT_ID, database_name, err
+                )
+            )
+            return
+        self.worker_connections.add(connection)
+        try:
+            cursor = connection.cursor()
+            relations = self.rank_relations(cursor, self.get_threshold(database_connection))
+            for rank, (relation, age, size, may_vacuum) in enumerate(relations, start=1):
+                logger.info(
+                    "senzing-{0}0014I Governor vacuum advisory for {1} database. Rank: {2}; Relation: {3}; age(XID): {4}; Size: {5} bytes; May vacuum: {6}".format(
+                        SENZING_PRODUCT_ID, database_name, rank, relation, age, size, may_vacuum
+                    )
+                )
+            if not self.freeze:
+                return
+
+            # VACUUM's own cost-based delay keeps the I/O from competing with the load.
+
+            cursor.execute("SET vacuum_cost_delay = %s;", (self.cost_delay_in_milliseconds,))
+            cursor.execute("SET vacuum_cost_limit = %s;", (self.cost_limit,))
+            database_connection["vacuum_pid"] = connection.get_backend_pid()
+            for relation, age, size, may_vacuum in relations:
+                if not may_vacuum:
+                    continue
+                database_connection["vacuum_relation"] = relation
+                database_connection["vacuum_progress"] = None
+                logger.info(
+                    "senzing-{0}0015I Governor is running VACUUM (FREEZE) on {1} in {2} database. age(XID): {3}".format(
+                        SENZING_PRODUCT_ID, relation, database_name, age
+                    )
+                )
+                start_time = time.perf_counter()
+                cursor.execute("VACUUM (FREEZE) {0};".format(relation))
+                logger.info(
+                    "senzing-{0}0016I Governor finished VACUUM (FREEZE) on {1} in {2} database in {3:.1f} seconds.".format(
+                        SENZING_PRODUCT_ID, relation, database_name, time.perf_counter() - start_time
+                    )
+                )
+        except Exception as err:
+            logger.warning(
+                "senzing-{0}0711W Governor vacuum advisory failed on {1} database. Error: {2}".format(
+                    SENZING_PRODUCT_ID, database_name, err
+                )
+            )
+        finally:
+            database_connection["vacuum_pid"] = None
+            database_connection["vacuum_relation"] = None
+            self.worker_connections.discard(connection)
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def is_vacuuming(self, database_connection):
+        """True while a job runs VACUUM (FREEZE) for the database, so there is progress to read."""
+
+        future = database_connection.get("vacuum_future")
+        return future is not None and not future.done() and database_connection.get("vacuum_pid") is not None
+
+    def poll_progress(self, database_connection, cursor):
+        """Read pg_stat_progress_vacuum for the running VACUUM and log it when its phase changes."""
+
+        cursor.execute(self.sql_stmt_progress, (database_connection.get("vacuum_pid"),))
+        self.report_progress(database_connection, cursor.fetchone())
+
+    async def poll_progress_async(self, database_connection, cursor):
+        """Same as poll_progress(), on an asynchronous cursor."""
+
+        await cursor.execute(self.sql_stmt_progress, (database_connection.get("vacuum_pid"),))
+        self.report_progress(database_connection, await cursor.fetchone())
+
+    def report_progress(self, database_connection, progress):
+        """Keep a pg_stat_progress_vacuum reading and log it when its phase changes."""
+
+        last_progress = database_connection.get("vacuum_progress")
+        database_connection["vacuum_progress"] = progress
+        if progress is None or (last_progress is not None and last_progress[0] == progress[0]):
+            return
+        phase, heap_blks_total, heap_blks_scanned, heap_blks_vacuumed = progress
+        self.log_info(
+            "senzing-%s0017I Governor VACUUM (FREEZE) of %s in %s database is %s. Heap blocks scanned: %s of %s; vacuumed: %s",
+            SENZING_PRODUCT_ID,
+            database_connection.get("vacuum_relation"),
+            database_connection.get("parsed_database_url", {}).get("dbname"),
+            phase,
+            heap_blks_scanned,
+            heap_blks_total,
+            heap_blks_vacuumed,
+        )
+
+    def close(self):
+        """Stop queued jobs and cancel any VACUUM in progress."""
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        for connection in list(self.worker_connections):
+            try:
+                connection.cancel()
+            except Exception:
+                pass
+
+
+# -----------------------------------------------------------------------------
+# Metrics
+# -----------------------------------------------------------------------------
+
+
+class Histogram:
+    """Cumulative histogram in the Prometheus style: bucket counts, sum and count."""
+
+    def __init__(self, buckets):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name, labels=""):
+        separator = "," if labels else ""
+        lines = []
+        cumulative = 0
+        for bucket, count in zip(self.buckets + ["+Inf"], self.counts):
+            cumulative += count
+            lines.append('{0}_bucket{{{1}{2}le="{3}"}} {4}'.format(name, labels, separator, bucket, cumulative))
+        label_set = "{{{0}}}".format(labels) if labels else ""
+        lines.append("{0}_sum{1} {2}".format(name, label_set, self.sum))
+        lines.append("{0}_count{1} {2}".format(name, label_set, self.count))
+        return lines
+
+
+def metric_label(value):
+    """Escape a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class GovernorMetrics:
+    """
+    Metrics of governor decisions, rendered in the Prometheus text exposition format.
+    Everything here is updated when databases are checked, never on every govern() call.
+    """
+
+    duration_buckets = [0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0]
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.xid_age = {}
+        self.oldest_relation = {}
+        self.probe_duration = {}
+        self.lock_wait = Histogram(self.duration_buckets)
+        self.suggested_wait_seconds = 0.0
+        self.wait_time = 0.0
+        self.last_records = 0
+        self.emergency = {}
+
+    def observe_probe(self, database_name, oid_name, watermark, duration):
+        with self.lock:
+            self.xid_age[database_name] = watermark
+            self.oldest_relation[database_name] = (oid_name, watermark)
+            if database_name not in self.probe_duration:
+                self.probe_duration[database_name] = Histogram(self.duration_buckets)
+            self.probe_duration[database_name].observe(duration)
+
+    def observe_emergency(self, database_name, emergency):
+        with self.lock:
+            self.emergency[database_name] = emergency
+
+    def observe_lock_wait(self, duration):
+        with self.lock:
+            self.lock_wait.observe(duration)
+
+    def observe_wait_time(self, wait_time, records):
+        """
+        Every record governed since the previous check was told to wait self.wait_time,
+        so the suggested seconds are accounted for in bulk.
+        """
+
+        with self.lock:
+            self.suggested_wait_seconds += max(self.wait_time, 0.0) * (records - self.last_records)
+            self.last_records = records
+            self.wait_time = wait_time
+
+    def render(self, govern_calls, records):
+        with self.lock:
+            suggested_wait_seconds = self.suggested_wait_seconds + max(self.wait_time, 0.0) * (
+                records - self.last_records
+            )
+            lines = [
+                "# HELP senzing_governor_govern_calls_total Calls to govern() and govern_many().",
+                "# TYPE senzing_governor_govern_calls_total counter",
+                "senzing_governor_govern_calls_total {0}".format(govern_calls),
+                "# HELP senzing_governor_records_total Records governed; a call to govern_many(n) counts n.",
+                "# TYPE senzing_governor_records_total counter",
+                "senzing_governor_records_total {0}".format(records),
+                "# HELP senzing_governor_suggested_wait_seconds_total Seconds of waiting suggested to callers of govern().",
+                "# TYPE senzing_governor_suggested_wait_seconds_total counter",
+                "senzing_governor_suggested_wait_seconds_total {0}".format(suggested_wait_seconds),
+                "# HELP senzing_governor_wait_seconds Wait time currently suggested by govern().",
+                "# TYPE senzing_governor_wait_seconds gauge",
+                "senzing_governor_wait_seconds {0}".format(self.wait_time),
+                "# HELP senzing_governor_xid_age Most recent age(XID) of each database.",
+                "# TYPE senzing_governor_xid_age gauge",
+            ]
+            for database_name, watermark in sorted(self.xid_age.items()):
+                lines.append(
+                    'senzing_governor_xid_age{{database="{0}"}} {1}'.format(metric_label(database_name), watermark)
+                )
+            lines += [
+                "# HELP senzing_governor_emergency_stop 1 while a database holds govern() at -1.0.",
+                "# TYPE senzing_governor_emergency_stop gauge",
+            ]
+            for database_name, emergency in sorted(self.emergency.items()):
+                lines.append(
+                    'senzing_governor_emergency_stop{{database="{0}"}} {1}'.format(
+                        metric_label(database_name), int(emergency)
+                    )
+                )
+            lines += [
+                "# HELP senzing_governor_oldest_relation_xid_age age(XID) of the oldest relation in each database.",
+                "# TYPE senzing_governor_oldest_relation_xid_age gauge",
+            ]
+            for database_name, (oid_name, watermark) in sorted(self.oldest_relation.items()):
+                lines.append(
+                    'senzing_governor_oldest_relation_xid_age{{database="{0}",relation="{1}"}} {2}'.format(
+                        metric_label(database_name), metric_label(oid_name), watermark
+                    )
+                )
+            lines += [
+                "# HELP senzing_governor_probe_duration_seconds Time taken to query a database for its XID age.",
+                "# TYPE senzing_governor_probe_duration_seconds histogram",
+            ]
+            for database_name, histogram in sorted(self.probe_duration.items()):
+                lines += histogram.render(
+                    "senzing_governor_probe_duration_seconds", 'database="{0}"'.format(metric_label(database_name))
+                )
+            lines += [
+                "# HELP senzing_governor_lock_wait_seconds Time govern() waited for counter_lock before a check.",
+                "# TYPE senzing_governor_lock_wait_seconds histogram",
+            ]
+            lines += self.lock_wait.render("senzing_governor_lock_wait_seconds")
+        return "\n".join(lines) + "\n"
+
+
+@functools.lru_cache(maxsize=None)
+def get_metrics_request_handler():
+    """The request handler of the metrics server.  Defined on first use, so http.server is only imported then."""
+
+    import http.server  # pylint: disable=import-outside-toplevel
+
+    class MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+        """Serves GET /metrics from the Governor attached to the server."""
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            if self.path.split("?")[0] not in ["/", "/metrics"]:
+                self.send_error(404)
+                return
+            body = self.server.governor.render_metrics().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format, *args)
+
+    return MetricsRequestHandler
+
+
+# -----------------------------------------------------------------------------
+# Serving wait times to other processes and hosts; see RemoteGovernor.
+# -----------------------------------------------------------------------------
+
+
+def parse_server_address(address):
+    """
+    Parse "udp://host:port" or "unix:///path/to/socket" into (socket family, address).
+    """
+
+    import socket  # pylint: disable=import-outside-toplevel
+
+    parsed = urlparse(address)
+    if parsed.scheme == "udp":
+        return socket.AF_INET, (parsed.hostname or "127.0.0.1", parsed.port or 0)
+    if parsed.scheme == "unix":
+        return socket.AF_UNIX, parsed.path
+    raise ValueError("Server address {0} is not udp://host:port or unix:///path".format(address))
+
+
+def handle_remote_request(request, client_address, server):
+    """
+    The socketserver request handler: answers one datagram from a RemoteGovernor.
+    The request is JSON: {"id": 1, "database": "G2_RES"}, where "database" is optional.
+    The response is JSON: {"id": 1, "wait_time": 0.5, "database": "G2", "age": 2.1, "max_batch_wait": 9.0},
+    where "age" is the seconds since the databases were checked and "max_batch_wait" caps the wait of a batch.
+    """
+
+    data, server_socket = request
+    try:
+        request = json.loads(data or b"{}")
+    except ValueError:
+        return
+    response = server.governor.get_remote_response(request)
+    server_socket.sendto(json.dumps(response).encode("utf-8"), client_address)
+
+
+class GovernorBase:
+    """What Governor and AsyncGovernor share: configuration, database connections, readings and wait times."""
+
+    sql_stmt = "SELECT c.oid::regclass, age(c.relfrozenxid) FROM pg_class c JOIN pg_namespace n on c.relnamespace = n.oid WHERE relkind IN ('r', 't', 'm') AND n.nspname NOT IN ('pg_toast') ORDER BY 2 DESC LIMIT 1;"
+    sql_stmt_fast = "SELECT datname, age(datfrozenxid) FROM pg_database WHERE datname = current_database();"
+    sql_standby_lag = "CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+    sql_stmt_standby = f"SELECT c.oid::regclass, age(c.relfrozenxid), {sql_standby_lag} FROM pg_class c JOIN pg_namespace n on c.relnamespace = n.oid WHERE relkind IN ('r', 't', 'm') AND n.nspname NOT IN ('pg_toast') ORDER BY 2 DESC LIMIT 1;"
+    sql_stmt_fast_standby = (
+        f"SELECT datname, age(datfrozenxid), {sql_standby_lag} FROM pg_database WHERE datname = current_database();"
+    )
+    sql_stmt_signals = (
+        "SELECT datname, age(datfrozenxid), mxid_age(datminmxid), pg_is_in_recovery(), "
+        "CASE WHEN NOT pg_is_in_recovery() THEN (SELECT COALESCE(MAX(EXTRACT(EPOCH FROM replay_lag)), 0) FROM pg_stat_replication) "
+        "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END, "
+        "autovacuums.wraparound, autovacuums.hidden, oldest.relation, oldest.age "
+        "FROM pg_database "
+        "CROSS JOIN (SELECT count(*) FILTER (WHERE query LIKE '%%(to prevent wraparound)') AS wraparound, "
+        "count(*) FILTER (WHERE query = '<insufficient privilege>') AS hidden "
+        "FROM pg_stat_activity WHERE backend_type = 'autovacuum worker') autovacuums "
+        "LEFT JOIN LATERAL (SELECT c.oid::regclass::text AS relation, age(c.relfrozenxid) AS age FROM pg_class c JOIN pg_namespace n on c.relnamespace = n.oid "
+        "WHERE age(pg_database.datfrozenxid) > %s AND relkind IN ('r', 't', 'm') AND n.nspname NOT IN ('pg_toast') ORDER BY 2 DESC LIMIT 1) oldest ON true "
+        "WHERE datname = current_database();"
+    )
 
     # -------------------------------------------------------------------------
     # Internal methods for database URL parsing.
@@ -100,7 +1164,7 @@ class Governor:
         # Detect an error condition where there are not enough safe characters.
 
         if len(unsafe_characters) > len(safe_characters):
-            logging.error(
+            logger.error(
                 "There are not enough safe characters to do the translation. Unsafe Characters: {0}; Safe Characters: {1}".format(
                     unsafe_characters, safe_characters
                 )
@@ -148,22 +1212,11 @@ class Governor:
         See https://stackoverflow.com/questions/10663093/use-python-format-string-in-reverse-for-parsing
         """
 
-        # First split on any keyword arguments, note that the names of keyword arguments will be in the
-        # 1st, 3rd, ... positions in this list
-
-        tokens = re.split(r"\{(.*?)\}", format_string)
-        keywords = tokens[1::2]
-
-        # Now replace keyword arguments with named groups matching them. We also escape between keyword
-        # arguments so we support meta-characters there. Re-join tokens to form our regexp pattern
-
-        tokens[1::2] = map("(?P<{}>.*)".format, keywords)
-        tokens[0::2] = map(re.escape, tokens[0::2])
-        pattern = "".join(tokens)
+        pattern, keywords = compile_format_string(format_string)
 
         # Use our pattern to match the given string, raise if it doesn't match
 
-        matches = re.match(pattern, string_to_be_parsed)
+        matches = pattern.match(string_to_be_parsed)
         if not matches:
             raise Exception("Format string did not match")
 
@@ -200,255 +1253,2676 @@ class Governor:
             result = default
         return result
 
+    def resolve_database_urls(self):
+        """
+        Database connection strings.
+        Precedence: 0) SENZING_GOVERNOR_CONFIG_FILE, 1) SENZING_GOVERNOR_DATABASE_URLS, 2) SENZING_DATABASE_URL, 3) SENZING_ENGINE_CONFIGURATION_JSON 4) parameters
+        """
+
+        if self.config_database_urls is not None:
+            return self.config_database_urls
+        result = os.getenv("SENZING_GOVERNOR_DATABASE_URLS", os.getenv("SENZING_DATABASE_URL"))
+        if result is None:
+            result = self.extract_database_urls(
+                os.getenv("SENZING_ENGINE_CONFIGURATION_JSON"), self.database_urls_parameter
+            )
+        return result
+
     # -------------------------------------------------------------------------
     # Internal methods for accessing database.
     # -------------------------------------------------------------------------
 
-    def get_current_watermark(self, cursor):
+    def load_database_connections(self):
+        """Resolve and parse the database URLs into database_connections.  Only the first call does any work."""
 
-        cursor.execute(self.sql_stmt)
-        result = cursor.fetchone()
-        return result[0], result[1]
+        if self.database_connections_loaded:
+            return
+        with self.database_connections_lock:
+            if self.database_connections_loaded:
+                return
+            self.database_urls = self.resolve_database_urls()
+            if self.database_urls and not self.subscriber:
+                self.monitored_database_connections = self.build_database_connections(self.database_urls)
+            self.database_connections_loaded = True
 
-    # -------------------------------------------------------------------------
-    # Support for Python Context Manager.
-    # -------------------------------------------------------------------------
+    def build_database_connections(self, database_urls, existing=None):
+        """
+        Bookkeeping for each database in database_urls, keyed by URL.
+        Entries of "existing" with the same URL and probe URL are kept as they are, connection and history included.
+        """
 
-    def __enter__(self):
-        return self
+        result = {}
+        existing = existing or {}
+        sql_connection_strings = database_urls.split(self.list_separator)
+
+        # Probe URLs, if any, pair up with database URLs by position.  An empty entry probes the database itself.
+
+        probe_connection_strings = []
+        if self.probe_database_urls:
+            probe_connection_strings = self.probe_database_urls.split(self.list_separator)
+            if len(probe_connection_strings) != len(sql_connection_strings):
+                self.log_warning(
+                    "senzing-%s0713W SENZING_GOVERNOR_PROBE_DATABASE_URLS has %s entries but there are %s database URLs. Unmatched databases are probed directly.",
+                    SENZING_PRODUCT_ID,
+                    len(probe_connection_strings),
+                    len(sql_connection_strings),
+                )
+        for database_connection_string, probe_connection_string in itertools.zip_longest(
+            sql_connection_strings, probe_connection_strings[: len(sql_connection_strings)]
+        ):
+
+            probe_database_url = self.parse_database_url(probe_connection_string) if probe_connection_string else None
+            existing_database_connection = existing.get(database_connection_string)
+            if existing_database_connection is not None:
+                if existing_database_connection.get("probe_database_url") == probe_database_url:
+                    result[database_connection_string] = existing_database_connection
+                    continue
 
-    def __exit__(self, type, value, traceback):
-        self.close()
+            parsed_database_url = self.parse_database_url(database_connection_string)
 
-    # -------------------------------------------------------------------------
-    # Public API methods.
-    #  - govern()
-    #  - close()
-    # -------------------------------------------------------------------------
+            # Only "postgresql://" databases are monitored.
 
-    def __init__(
-        self,
-        database_urls=None,
-        high_watermark=1_500_000_000,
-        hint="",
-        interval=100_000,
-        list_separator=",",
-        low_watermark=1_200_000_000,
-        log_interval_in_seconds=600,
-        check_time_interval_in_seconds=5,
-        *args,
-        **kwargs,
-    ):
+            schema = database_connection_string.split(":")[0]
+            if schema != "postgresql":
+                self.log_info(
+                    "senzing-%s0701W SENZING_GOVERNOR_DATABASE_URLS contains a non-postgres URL:  %s://%s:xxxxxxxx@%s:%s/%s",
+                    SENZING_PRODUCT_ID,
+                    schema,
+                    parsed_database_url.get("user"),
+                    parsed_database_url.get("host"),
+                    parsed_database_url.get("port"),
+                    parsed_database_url.get("dbname"),
+                )
+                continue
 
-        logging.info(
-            "senzing-{0}0001I Using governor-postgresql-transaction-id Governor. Version: {1} Updated: {2}".format(
-                SENZING_PRODUCT_ID, __version__, __updated__
+            # Connections are made lazily, when the database is first probed.
+
+            self.log_info(
+                "senzing-%s0003I Governor monitoring %s://%s:xxxxxxxx@%s:%s/%s",
+                SENZING_PRODUCT_ID,
+                schema,
+                parsed_database_url.get("user"),
+                parsed_database_url.get("host"),
+                parsed_database_url.get("port"),
+                parsed_database_url.get("dbname"),
             )
-        )
+            database_connection = self.new_database_connection(parsed_database_url)
+            database_connection["database_url"] = database_connection_string
+            result[database_connection_string] = database_connection
+            if probe_database_url is not None:
+                database_connection["probe_database_url"] = probe_database_url
+                self.log_info(
+                    "senzing-%s0018I Governor probing %s database through %s:%s/%s",
+                    SENZING_PRODUCT_ID,
+                    parsed_database_url.get("dbname"),
+                    probe_database_url.get("host"),
+                    probe_database_url.get("port"),
+                    probe_database_url.get("dbname"),
+                )
+        return result
 
-        # Instance variables. Precedence: 1) OS Environment variables, 2) parameters
-        self.old_wait_time = 0.0
-        self.counter = 0
-        self.counter_lock = threading.Lock()
-        self.last_log_time = 0
-        # update this data structure to change the back-off step times.
-        #  1.0 means that we're at the highwater mark so we should pause longer
-        #  to allow the database to catch up.  More steps could be added or times
-        #  modified to fit required performance characteristics.
-        # <ratio>:<time in seconds>
-        self.step_ratios = [
-            (1.0, -1.0),
-            (0.9, 9.0),
-            (0.8, 6.0),
-            (0.7, 4.0),
-            (0.6, 2.0),
-            (0.5, 1.0),
-            (0.4, 0.7),
-            (0.3, 0.5),
-            (0.2, 0.2),
-            (0.1, 0.1),
-            (0.0, 0.0),
+    def warm_up(self):
+        """Load database_connections and start connecting on the connector thread, without waiting for either."""
+
+        import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+        def run():
+            self.load_database_connections()
+            self.flush_log()
+            for database_connection in list(self.monitored_database_connections.values()):
+                self.schedule_connect(database_connection)
+
+        if self.connect_executor is None:
+            self.connect_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="senzing-governor-connect"
+            )
+        self.connect_executor.submit(run)
+
+    def new_database_connection(self, parsed_database_url):
+        """
+        Bookkeeping for one monitored database.  No connection is made here;
+        connections are opened in the background when first probed.
+        """
+
+        return {
+            "parsed_database_url": parsed_database_url,
+            "connection": None,
+            "cursor": None,
+            "connect_failures": 0,
+            "connect_future": None,
+            "next_connect_time": 0.0,
+            "unreachable_since": None,
+            "last_reading": None,
+            "history": collections.deque(maxlen=self.trend_history_size),
+        }
+
+    def connect_database(self, parsed_database_url):
+        """Open a read-only, autocommit connection used only for probing.  Returns (connection, cursor)."""
+
+        return self.open_probe_connection(parsed_database_url, read_only_session=True)
+
+    def connect_probe_database(self, parsed_probe_database_url):
+        """
+        Connect to the database's SENZING_GOVERNOR_PROBE_DATABASE_URLS entry.  Returns (connection, cursor).
+        Session settings are left alone, as a pooler such as PgBouncer may pass the server connection to other clients.
+        """
+
+        return self.open_probe_connection(parsed_probe_database_url, read_only_session=False)
+
+    def open_probe_connection(self, parsed_database_url, read_only_session):
+        def connect():
+            return self.new_probe_connection(parsed_database_url, read_only_session)
+
+        if self.share_probe_connections:
+            key = (read_only_session,) + tuple(sorted(parsed_database_url.items()))
+            connection = SharedConnection.acquire(key, connect)
+        else:
+            connection = connect()
+        return connection, connection.cursor()
+
+    def new_probe_connection(self, parsed_database_url, read_only_session):
+        import psycopg2  # pylint: disable=import-outside-toplevel
+
+        connection = psycopg2.connect(**parsed_database_url)
+        if read_only_session:
+            connection.set_session(autocommit=True, isolation_level="READ UNCOMMITTED", readonly=True)
+        else:
+            connection.autocommit = True
+        return connection
+
+    def connect_vacuum_database(self, parsed_database_url):
+        """Open a read-write, autocommit connection for VACUUM, which cannot run inside a transaction."""
+
+        import psycopg2  # pylint: disable=import-outside-toplevel
+
+        connection = psycopg2.connect(**parsed_database_url)
+        connection.set_session(autocommit=True)
+        return connection
+
+    def disconnect_database(self, database_connection):
+        """Forget a connection, closing it quietly.  The cursor is cleared first so probes stop using it."""
+
+        cursor = database_connection.get("cursor")
+        connection = database_connection.get("connection")
+        database_connection["cursor"] = None
+        database_connection["connection"] = None
+        for resource in [cursor, connection]:
+            try:
+                if resource is not None:
+                    resource.close()
+            except Exception:
+                pass
+
+    def schedule_connect(self, database_connection):
+        """Ask the connector thread to (re)connect, unless an attempt is running or backing off."""
+
+        import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+        future = database_connection.get("connect_future")
+        if future is not None and not future.done():
+            return
+        if self.clock() < database_connection.get("next_connect_time", 0.0):
+            return
+        if self.connect_executor is None:
+            self.connect_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="senzing-governor-connect"
+            )
+        database_connection["connect_future"] = self.connect_executor.submit(self.reconnect, database_connection)
+
+    def reconnect(self, database_connection):
+        """Runs on the connector thread.  Failures back off exponentially, capped at reconnect_max_delay_in_seconds."""
+
+        parsed_database_url = database_connection.get("parsed_database_url", {})
+        probe_database_url = database_connection.get("probe_database_url")
+        try:
+            if probe_database_url is None:
+                connection, cursor = self.connect_database(parsed_database_url)
+            else:
+                parsed_database_url = probe_database_url
+                connection, cursor = self.connect_probe_database(probe_database_url)
+        except Exception as err:
+            self.record_connect_failure(database_connection, parsed_database_url, err)
+            return
+        self.record_connect(database_connection, parsed_database_url, connection, cursor)
+
+    def record_connect(self, database_connection, parsed_database_url, connection, cursor):
+        database_connection["connection"] = connection
+        database_connection["cursor"] = cursor
+        database_connection["connect_failures"] = 0
+        logger.info(
+            "senzing-{0}0011I Governor connected to {1} database on host {2}.".format(
+                SENZING_PRODUCT_ID, parsed_database_url.get("dbname"), parsed_database_url.get("host")
+            )
+        )
+
+    def record_connect_failure(self, database_connection, parsed_database_url, err):
+        """Schedule the next attempt, backing off exponentially up to reconnect_max_delay_in_seconds."""
+
+        self.record_failure(database_connection)
+        delay = min(
+            self.reconnect_max_delay_in_seconds,
+            self.reconnect_min_delay_in_seconds * 2 ** (database_connection["connect_failures"] - 1),
+        )
+        database_connection["next_connect_time"] = self.clock() + delay
+        logger.warning(
+            "senzing-{0}0705W Governor could not connect to {1} database on host {2}. Retrying in {3} seconds. Error: {4}".format(
+                SENZING_PRODUCT_ID, parsed_database_url.get("dbname"), parsed_database_url.get("host"), delay, err
+            )
+        )
+
+    def record_failure(self, database_connection):
+        database_connection["connect_failures"] = database_connection.get("connect_failures", 0) + 1
+        if database_connection.get("unreachable_since") is None:
+            database_connection["unreachable_since"] = self.clock()
+
+    def probe_database(self, database_connection):
+        """
+        Probe one database.  Returns (database_connection, oid_name, watermark),
+        or None if the database cannot be reached right now.
+        A broken connection is dropped and a reconnect is scheduled in the background.
+        """
+
+        cursor = database_connection.get("cursor")
+        if cursor is None and self.probe is None:
+            self.schedule_connect(database_connection)
+            return None
+
+        try:
+            start_time = time.perf_counter()
+            if self.probe is not None:
+                oid_name, watermark = self.probe(database_connection)
+            elif self.probe_strategy == "signals":
+                reading = self.probe_signals(database_connection, cursor)
+                if reading is None:
+                    return None
+                oid_name, watermark = reading
+            else:
+                reading = self.read_watermark(database_connection, cursor)
+                if reading is None:
+                    return None
+                oid_name, watermark = reading
+            duration = time.perf_counter() - start_time
+        except Exception as err:
+            parsed_database_url = database_connection.get("parsed_database_url", {})
+            self.log_warning(
+                "senzing-%s0706W Governor lost connection to %s database on host %s. Error: %s",
+                SENZING_PRODUCT_ID,
+                parsed_database_url.get("dbname"),
+                parsed_database_url.get("host"),
+                err,
+            )
+            self.disconnect_database(database_connection)
+            self.record_failure(database_connection)
+            if self.probe is None:
+                self.schedule_connect(database_connection)
+            return None
+
+        self.record_reading(database_connection, oid_name, watermark, duration)
+        if self.vacuum_advisor is not None:
+            try:
+                self.vacuum_advisor.observe(database_connection, cursor, watermark)
+            except Exception as err:
+                self.log_warning(
+                    "senzing-%s0711W Governor vacuum advisory failed on %s database. Error: %s",
+                    SENZING_PRODUCT_ID,
+                    database_connection.get("parsed_database_url", {}).get("dbname"),
+                    err,
+                )
+        return database_connection, oid_name, watermark
+
+    def read_watermark(self, database_connection, cursor):
+        """
+        (name, age) from get_current_watermark(), or None when the standby behind a probe URL is too far behind.
+        The standby's lag is read in the same query as the age; see get_standby_sql_stmt().
+        """
+
+        low_watermark = self.get_watermarks(database_connection)[0]
+        sql_stmt = self.get_standby_sql_stmt(database_connection)
+        if sql_stmt is None:
+            return self.get_current_watermark(cursor, low_watermark)
+        cursor.execute(sql_stmt)
+        name, watermark, lag = cursor.fetchone()
+        if not self.is_standby_current(database_connection, float(lag or 0.0)):
+            return None
+        if sql_stmt == self.sql_stmt_fast_standby and watermark > low_watermark:
+            cursor.execute(self.sql_stmt)
+            name, watermark = cursor.fetchone()[:2]
+        return name, watermark
+
+    def get_standby_sql_stmt(self, database_connection):
+        """
+        The probe query that also reads how many seconds a hot standby is behind its primary (0 for a primary),
+        or None when lag is not checked.  Only probe URLs are checked, and only when standby_max_lag_in_seconds is set.
+        """
+
+        if database_connection.get("probe_database_url") is None or self.standby_max_lag_in_seconds <= 0:
+            return None
+        if self.probe_strategy == "fast":
+            return self.sql_stmt_fast_standby
+        return self.sql_stmt_standby
+
+    def is_standby_current(self, database_connection, lag):
+        """
+        A standby's frozen XID ages are as old as its replay.  When it is too far behind,
+        the reading is refused and the database counts as unreachable.
+        """
+
+        if lag <= self.standby_max_lag_in_seconds or self.standby_max_lag_in_seconds <= 0:
+            return True
+        self.log_warning(
+            "senzing-%s0712W Governor probe of %s database on host %s refused: standby is %.0f seconds behind, more than %s.",
+            SENZING_PRODUCT_ID,
+            database_connection.get("probe_database_url", {}).get("dbname"),
+            database_connection.get("probe_database_url", {}).get("host"),
+            lag,
+            self.standby_max_lag_in_seconds,
+        )
+        if database_connection.get("unreachable_since") is None:
+            database_connection["unreachable_since"] = self.clock()
+        return False
+
+    def record_reading(self, database_connection, oid_name, watermark, duration=0.0):
+        """Remember a successful probe: as the fallback reading, and in the age history used for trends."""
+
+        now = self.clock()
+        database_connection["unreachable_since"] = None
+        database_connection["last_reading"] = (oid_name, watermark, now)
+        if "history" not in database_connection:
+            database_connection["history"] = collections.deque(maxlen=self.trend_history_size)
+        database_connection["history"].append((now, watermark))
+        if self.metrics is not None:
+            self.metrics.observe_probe(
+                database_connection.get("parsed_database_url", {}).get("dbname"), oid_name, watermark, duration
+            )
+
+    def unreachable_reading(self, database_connection):
+        """
+        What to report for a database that could not be probed.
+          - A recent reading (within stale_reading_max_age_in_seconds) is reused.
+          - A database still making its first connection is left out.
+          - Otherwise "fail-open" leaves the database out and
+            "fail-closed" reports it at the high watermark.
+        """
+
+        last_reading = database_connection.get("last_reading")
+        if last_reading is not None and (self.clock() - last_reading[2]) <= self.stale_reading_max_age_in_seconds:
+            return database_connection, last_reading[0], last_reading[1]
+        if database_connection.get("unreachable_since") is None:
+            return None
+        if self.unreachable_policy == "fail-closed":
+            return database_connection, "unreachable", self.get_watermarks(database_connection)[1]
+        return None
+
+    def get_current_watermark(self, cursor, low_watermark=None):
+        """
+        Return (name, age) of the oldest transaction ID.
+        With the "fast" probe strategy, the database-wide age from pg_database is used.
+        Only when it is above the low watermark (default: the Governor's) is pg_class scanned for the oldest relation.
+        Because age(datfrozenxid) is never less than age(relfrozenxid) of any relation,
+        the fast probe cannot hide a relation that needs attention.
+        """
+
+        if low_watermark is None:
+            low_watermark = self.low_watermark
+        if self.probe_strategy == "fast":
+            cursor.execute(self.sql_stmt_fast)
+            result = cursor.fetchone()
+            if result[1] <= low_watermark:
+                return result[0], result[1]
+
+        cursor.execute(self.sql_stmt)
+        result = cursor.fetchone()
+        return result[0], result[1]
+
+    def probe_signals(self, database_connection, cursor):
+        """
+        The "signals" probe strategy.  One query reads the age(XID), MultiXact age, replay lag and
+        number of anti-wraparound autovacuums; see read_signals().  As with the "fast" probe strategy,
+        the same query only scans pg_class for the oldest relation when above the low watermark.
+        Returns (name, age) like get_current_watermark(), or None when a standby is too far behind.
+        """
+
+        cursor.execute(self.sql_stmt_signals, (self.get_watermarks(database_connection)[0],))
+        return self.read_signals(database_connection, cursor.fetchone())
+
+    def read_signals(self, database_connection, row):
+        """
+        Keep a row of sql_stmt_signals in database_connection["signals"].  Returns (name, age) of the
+        oldest relation when above the low watermark, otherwise (datname, age(XID)),
+        or None when the row comes from a standby, through a probe URL, that is too far behind.
+        On a primary, replay lag is that of its slowest standby; on a standby, its own.
+        Without pg_read_all_stats (granted by pg_monitor), the query text of autovacuum workers is hidden,
+        so wraparound_vacuums is unknown and left out rather than reported as 0.
+        """
+
+        (
+            datname,
+            xid_age,
+            multixact_age,
+            in_recovery,
+            replay_lag,
+            wraparound_vacuums,
+            hidden_vacuums,
+            relation,
+            relation_age,
+        ) = row
+        replay_lag = float(replay_lag or 0.0)
+        if in_recovery and database_connection.get("probe_database_url") is not None:
+            if not self.is_standby_current(database_connection, replay_lag):
+                return None
+        if hidden_vacuums:
+            if not database_connection.get("hidden_vacuums_logged"):
+                database_connection["hidden_vacuums_logged"] = True
+                self.log_warning(
+                    "senzing-%s0718W Governor cannot see the query text of autovacuum workers in %s database. Grant pg_monitor or pg_read_all_stats to count anti-wraparound autovacuums.",
+                    SENZING_PRODUCT_ID,
+                    datname,
+                )
+            wraparound_vacuums = None
+        database_connection["signals"] = {
+            "multixact_age": multixact_age,
+            "replay_lag": replay_lag,
+            "wraparound_vacuums": wraparound_vacuums,
+        }
+        if relation is not None:
+            return relation, relation_age
+        return datname, xid_age
+
+    def get_signal_wait_times(self, database_connection):
+        """
+        (signal, value, wait time) for each signal above its low watermark.
+        The wait strategy maps each signal between its own watermarks, as it does age(XID).
+        Above its high watermark a signal gets the largest wait time; only age(XID) stops callers with -1.0.
+        """
+
+        result = []
+        signals = database_connection.get("signals") or {}
+        for signal_name, (low_watermark, high_watermark) in self.signal_watermarks.items():
+            value = signals.get(signal_name)
+            if value is None or value <= low_watermark or high_watermark <= low_watermark:
+                continue
+            watermark_ratio = min((value - low_watermark) / (high_watermark - low_watermark), 1.0)
+            result.append((signal_name, value, self.wait_strategy.get_wait_time(watermark_ratio)))
+        return result
+
+    def probe_databases(self):
+        """
+        Query every database for its current watermark.
+        The queries run concurrently on probe threads, so the time taken is that of the slowest database,
+        not the sum of all of them, and a hung query, even of a single database, is given up on
+        after probe_timeout_in_seconds.
+        An injected probe is called inline instead, so it sees only the Governor's clock.
+        Returns a list of (database_connection, oid_name, watermark).
+        """
+
+        import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+        database_connections = list(self.database_connections.values())
+        if not database_connections:
+            return []
+
+        if self.probe is not None:
+            results = [self.probe_database(database_connection) for database_connection in database_connections]
+            return self.apply_unreachable_policy(database_connections, results)
+
+        # One probe thread per database.  When a reloaded configuration changes the number of databases,
+        # a new pool replaces the old one, which is left to finish the probes it is running.
+
+        if self.probe_executor is None or self.probe_executor_size != len(database_connections):
+            if self.probe_executor is not None:
+                self.probe_executor.shutdown(wait=False)
+            self.probe_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(database_connections), thread_name_prefix="senzing-governor-probe"
+            )
+            self.probe_executor_size = len(database_connections)
+
+        # Submit a probe for each database, unless its previous probe is still outstanding.
+        # A cursor must not be used by two threads at once.
+
+        futures = {}
+        for database_connection in database_connections:
+            future = database_connection.get("probe_future")
+            if future is None or future.done():
+                future = self.probe_executor.submit(self.probe_database, database_connection)
+                database_connection["probe_future"] = future
+            futures[future] = database_connection
+
+        done, not_done = concurrent.futures.wait(futures, timeout=self.probe_timeout_in_seconds)
+
+        for future in not_done:
+            self.log_warning(
+                "senzing-%s0704W Governor probe of %s database did not complete within %s seconds.",
+                SENZING_PRODUCT_ID,
+                futures[future].get("parsed_database_url", {}).get("dbname"),
+                self.probe_timeout_in_seconds,
+            )
+
+        # Keep the order of self.database_connections so logging is predictable.
+
+        results = [future.result() if future in done else None for future in futures]
+        return self.apply_unreachable_policy(list(futures.values()), results)
+
+    def apply_unreachable_policy(self, database_connections, results):
+        """Replace missing probe results using unreachable_reading(); drop those still missing."""
+
+        readings = []
+        for database_connection, result in zip(database_connections, results):
+            if result is None:
+                result = self.unreachable_reading(database_connection)
+            if result is not None:
+                readings.append(result)
+        return readings
+
+    def check_databases(self):
+        """
+        Go through each database connection to determine the wait time.
+        Returns a GovernorSnapshot describing the worst database.
+        """
+
+        for database_connection in self.reload_config_if_changed():
+            self.disconnect_database(database_connection)
+        if not self.profiling:
+            return self.evaluate_readings(self.probe_databases())
+
+        start_time = time.perf_counter()
+        readings = self.probe_databases()
+        probe_time = time.perf_counter()
+        result = self.evaluate_readings(readings)
+        self.add_profile_phase("probe", probe_time - start_time)
+        self.add_profile_phase("evaluate", time.perf_counter() - probe_time)
+        return result
+
+    def evaluate_readings(self, readings):
+        """
+        Turn the (database_connection, oid_name, watermark) readings from probe_databases()
+        into a GovernorSnapshot.  No database access is done here.
+        Every database is evaluated, even after one has been found in an emergency.
+        """
+
+        # The wait time is worked out here and published once at the end,
+        # so govern() never sees a half-evaluated value.
+
+        suggested_wait_time = 0.0
+        constraining_wait_time = WaitTime(0.0)
+        database_wait_times = {}
+        any_emergency = False
+        worst_watermark = 0
+        worst_oid_name = None
+        worst_database_name = None
+        records_budget = None
+
+        # Go through each database connection to determine if watermark is above high_watermark.
+
+        for database_connection, oid_name, watermark in readings:
+            if watermark > worst_watermark:
+                worst_watermark = watermark
+                worst_oid_name = oid_name
+                worst_database_name = database_connection.get("parsed_database_url", {}).get("dbname")
+
+            # The token bucket budget comes from the database with the least headroom below its own watermarks.
+
+            if self.token_shaper is not None:
+                database_records_budget = self.get_records_budget(watermark, *self.get_watermarks(database_connection))
+                if database_records_budget is not None:
+                    records_budget = (
+                        database_records_budget
+                        if records_budget is None
+                        else min(records_budget, database_records_budget)
+                    )
+
+            self.log_check(database_connection, oid_name, watermark)
+            database_wait_time, suggested_wait_time = self.evaluate_reading(
+                database_connection, oid_name, watermark, suggested_wait_time
+            )
+            any_emergency = any_emergency or database_wait_time < 0
+            constraining_wait_time = worse_wait_time(constraining_wait_time, database_wait_time)
+            self.add_database_wait_time(database_wait_times, database_connection, database_wait_time)
+
+        # A database in an emergency stays in it while it cannot be probed.
+
+        for database_connection in self.database_connections.values():
+            if database_connection.get("emergency"):
+                any_emergency = True
+                database_wait_time = WaitTime(-1.0, database_connection.get("parsed_database_url", {}).get("dbname"))
+                constraining_wait_time = worse_wait_time(constraining_wait_time, database_wait_time)
+                self.add_database_wait_time(database_wait_times, database_connection, database_wait_time)
+        if any_emergency:
+            suggested_wait_time = -1.0
+        wait_time = WaitTime(suggested_wait_time, constraining_wait_time.database if suggested_wait_time else None)
+        self.database_wait_times = database_wait_times
+        self.old_wait_time = wait_time
+        self.records_budget = records_budget
+        return GovernorSnapshot(wait_time, worst_watermark, worst_oid_name, worst_database_name, self.clock())
+
+    def log_check(self, database_connection, oid_name, watermark):
+        """Log a database's age(XID), at most once per log interval."""
+
+        current_log_time = self.clock()
+        if (current_log_time - self.last_log_time) > self.log_interval_in_seconds:
+            self.log_info(
+                "senzing-%s0004I Governor is checking PostgreSQL Transaction IDs. Host: %s; Database: %s; Current XID: %s (%s); High watermark XID: %s",
+                SENZING_PRODUCT_ID,
+                database_connection.get("parsed_database_url", {}).get("host"),
+                database_connection.get("parsed_database_url", {}).get("dbname"),
+                watermark,
+                oid_name,
+                self.get_watermarks(database_connection)[1],
+            )
+            self.last_log_time = current_log_time
+
+    def evaluate_reading(self, database_connection, oid_name, watermark, suggested_wait_time):
+        """
+        Evaluate one database's reading.  Returns its WaitTime, -1.0 in an emergency,
+        and suggested_wait_time raised to any larger wait that was logged for it.
+        """
+
+        database_name = database_connection.get("parsed_database_url", {}).get("dbname")
+        low_watermark, high_watermark = self.get_watermarks(database_connection)
+        database_wait_time = 0.0
+
+        # An emergency stop holds until the age falls back below the low watermark.
+
+        emergency = database_connection.get("emergency", False) and watermark >= low_watermark
+
+        # When we get above the low water mark, use our wait time function to start to slow down.
+
+        if watermark > low_watermark:
+            if self.predictive_horizon_in_seconds > 0:
+                wait_time = self.get_predictive_wait_time(database_connection, watermark)
+            else:
+                wait_time = self.get_wait_time(watermark, low_watermark, high_watermark)
+            database_wait_time = max(wait_time, 0.0)
+
+            if wait_time < 0:
+                emergency = True
+
+            # Log a message when the wait_time changes OR if the log interval has passed
+
+            current_log_time = self.clock()
+            log_interval_passed = (current_log_time - self.last_log_time) > self.log_interval_in_seconds
+            if not emergency and (wait_time > suggested_wait_time or log_interval_passed):
+                self.log_info(
+                    "senzing-%s0005I Governor suggests waiting %s seconds for %s database age(XID) to go from current value of %s (%s) to low watermark of %s.",
+                    SENZING_PRODUCT_ID,
+                    wait_time,
+                    database_name,
+                    watermark,
+                    oid_name,
+                    low_watermark,
+                )
+                suggested_wait_time = max(suggested_wait_time, wait_time)
+                self.last_log_time = current_log_time
+
+        # Other signals of the "signals" probe strategy each have their own watermarks.
+
+        for signal_name, value, wait_time in self.get_signal_wait_times(database_connection):
+            database_wait_time = max(database_wait_time, wait_time)
+            if not emergency and wait_time > suggested_wait_time:
+                self.log_info(
+                    "senzing-%s0019I Governor suggests waiting %s seconds for %s database %s to go from current value of %s to low watermark of %s.",
+                    SENZING_PRODUCT_ID,
+                    wait_time,
+                    database_name,
+                    signal_name,
+                    value,
+                    self.signal_watermarks[signal_name][0],
+                )
+                suggested_wait_time = wait_time
+
+        self.set_emergency(database_connection, emergency, oid_name, watermark)
+        return WaitTime(-1.0 if emergency else database_wait_time, database_name), suggested_wait_time
+
+    @staticmethod
+    def add_database_wait_time(database_wait_times, database_connection, database_wait_time):
+        """Keep a database's wait time for govern(database=...), under its name and its URL."""
+
+        database_name = database_connection.get("parsed_database_url", {}).get("dbname")
+        for key in [database_name, database_connection.get("database_url")]:
+            if key is not None:
+                database_wait_times[key] = worse_wait_time(
+                    database_wait_times.get(key, database_wait_time), database_wait_time
+                )
+
+    def set_emergency(self, database_connection, emergency, oid_name, watermark):
+        """Record whether a database is in an emergency stop, logging when that changes."""
+
+        database_name = database_connection.get("parsed_database_url", {}).get("dbname")
+        low_watermark, high_watermark = self.get_watermarks(database_connection)
+        if emergency != database_connection.get("emergency", False):
+            database_connection["emergency"] = emergency
+            if emergency:
+                self.log_warning(
+                    "senzing-%s0709W Governor is stopping all callers. %s database age(XID) of %s (%s) is at the high watermark of %s. Stopped until below the low watermark of %s.",
+                    SENZING_PRODUCT_ID,
+                    database_name,
+                    watermark,
+                    oid_name,
+                    high_watermark,
+                    low_watermark,
+                )
+            else:
+                self.log_info(
+                    "senzing-%s0013I Governor is resuming callers. %s database age(XID) of %s (%s) is below the low watermark of %s.",
+                    SENZING_PRODUCT_ID,
+                    database_name,
+                    watermark,
+                    oid_name,
+                    low_watermark,
+                )
+        if self.metrics is not None:
+            self.metrics.observe_emergency(database_name, emergency)
+
+    def get_emergency_databases(self):
+        """Names of the databases currently holding the emergency stop."""
+
+        return sorted(
+            database_connection.get("parsed_database_url", {}).get("dbname")
+            for database_connection in self.database_connections.values()
+            if database_connection.get("emergency")
+        )
+
+    # -------------------------------------------------------------------------
+    # Sharing snapshots between processes.
+    # -------------------------------------------------------------------------
+
+    def publish_snapshot(self, snapshot):
+        """Make a new snapshot visible to this process and, when publishing, to other processes."""
+
+        self.snapshot = snapshot
+        if self.shared_snapshot is not None and self.shared_memory_role == "publisher":
+            self.shared_snapshot.write(snapshot)
+        if self.metrics is not None:
+            self.metrics.observe_wait_time(snapshot.wait_time, self.get_records_counted())
+        if self.token_shaper is not None:
+            self.token_shaper.set_budget(self.records_budget, self.clock())
+        self.schedule_next_check()
+
+    # -------------------------------------------------------------------------
+    # Reloadable configuration.
+    # -------------------------------------------------------------------------
+
+    def reload_config(self):
+        """Re-read the config file at the next check, even if it looks unchanged.  Safe to call from a signal handler."""
+
+        self.config_reload_requested = True
+
+    def reload_config_if_changed(self):
+        """
+        Apply the config file if it changed since it was last read, or reload_config() was called.
+        Runs at the start of a check, on the thread making it, so each check sees one whole configuration
+        and govern() callers never wait for a reload.  Returns the database_connections that were dropped.
+        """
+
+        if self.config_file is None:
+            return []
+        try:
+            modified_time = os.stat(self.config_file).st_mtime_ns
+        except OSError as err:
+
+            # The error number stands in for the time, so each new error is logged once.
+
+            if self.config_file_modified_time != err.errno:
+                self.log_warning(
+                    "senzing-%s0715W Governor could not read configuration file %s. Keeping the current settings. Error: %s",
+                    SENZING_PRODUCT_ID,
+                    self.config_file,
+                    err,
+                )
+                self.config_file_modified_time = err.errno
+            return []
+        if modified_time == self.config_file_modified_time and not self.config_reload_requested:
+            return []
+        self.config_file_modified_time = modified_time
+        self.config_reload_requested = False
+        try:
+            with open(self.config_file, encoding="utf-8") as config_file:
+                config = json.load(config_file)
+            return self.apply_config(config)
+        except (OSError, TypeError, ValueError) as err:
+            self.log_warning(
+                "senzing-%s0715W Governor could not read configuration file %s. Keeping the current settings. Error: %s",
+                SENZING_PRODUCT_ID,
+                self.config_file,
+                err,
+            )
+            return []
+
+    def apply_config(self, config):
+        """
+        Apply a dict of RELOADABLE_SETTINGS.  Every value is checked first, so either all of them
+        are applied or, by raising ValueError, none.  Returns the database_connections that were dropped.
+        """
+
+        unknown_settings = sorted(set(config) - set(RELOADABLE_SETTINGS))
+        if unknown_settings:
+            raise ValueError("Unknown settings: {0}".format(unknown_settings))
+        high_watermark = int(config.get("high_watermark", self.high_watermark))
+        low_watermark = int(config.get("low_watermark", self.low_watermark))
+        if low_watermark >= high_watermark:
+            raise ValueError("low_watermark {0} is not below high_watermark {1}".format(low_watermark, high_watermark))
+        interval = int(config.get("interval", self.interval))
+        check_time_interval_in_seconds = int(
+            config.get("check_time_interval_in_seconds", self.check_time_interval_in_seconds)
+        )
+        step_ratios = sorted(
+            [(float(ratio), float(wait_time)) for ratio, wait_time in config.get("step_ratios", self.step_ratios)],
+            reverse=True,
+        )
+        database_watermarks = self.database_watermarks
+        if "database_watermarks" in config:
+            database_watermarks = {
+                database_name: (int(low), int(high))
+                for database_name, (low, high) in parse_watermarks(
+                    config["database_watermarks"], self.list_separator
+                ).items()
+            }
+        signal_watermarks = self.signal_watermarks
+        if "signal_watermarks" in config:
+            signal_watermarks = parse_signal_watermarks(
+                config["signal_watermarks"], self.list_separator, self.log_warning
+            )
+        database_urls = config.get("database_urls", self.config_database_urls)
+
+        # Everything is valid.  Swap it in.
+
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.database_watermarks = database_watermarks
+        self.signal_watermarks = signal_watermarks
+        self.step_ratios = step_ratios
+        self.predictive_max_wait_in_seconds = max(step[1] for step in step_ratios)
+        self.interval = interval
+        self.check_time_interval_in_seconds = check_time_interval_in_seconds
+        dropped = []
+        if database_urls is not None and database_urls != self.config_database_urls:
+            self.config_database_urls = database_urls
+            if self.database_connections_loaded and not self.subscriber:
+                dropped = self.update_database_connections(database_urls)
+        self.log_info(
+            "senzing-%s0020I Governor applied configuration file %s: %s",
+            SENZING_PRODUCT_ID,
+            self.config_file,
+            ", ".join(sorted(config)),
+        )
+        return dropped
+
+    def update_database_connections(self, database_urls):
+        """
+        Monitor database_urls from now on.  Databases already monitored keep their connections and history.
+        The new dict replaces the old one whole, so anyone iterating the old one is not disturbed.
+        Returns the database_connections that were dropped, for the caller to close.
+        """
+
+        existing = self.monitored_database_connections
+        database_connections = self.build_database_connections(database_urls, existing)
+        self.database_urls = database_urls
+        self.monitored_database_connections = database_connections
+        return [
+            database_connection
+            for database_url, database_connection in existing.items()
+            if database_connections.get(database_url) is not database_connection
         ]
 
-        # Database connection string. Precedence: 1) SENZING_GOVERNOR_DATABASE_URLS, 2) SENZING_DATABASE_URL, 3) SENZING_ENGINE_CONFIGURATION_JSON 4) parameters
+    # -------------------------------------------------------------------------
+    # Scheduling checks.
+    # -------------------------------------------------------------------------
+
+    def get_next_check_interval(self):
+        """
+        Seconds until the next check.  Normally check_time_interval_in_seconds.
+        With adaptive checking the interval stretches, up to max_check_time_interval_in_seconds,
+        while every database is well below the low watermark and not closing in on it,
+        and shrinks to min_check_time_interval_in_seconds at or above the low watermark.
+        """
+
+        if not self.adaptive_check_interval or not self.database_connections:
+            return self.check_time_interval_in_seconds
+
+        result = self.max_check_time_interval_in_seconds
+        for database_connection in list(self.database_connections.values()):
+            history = database_connection.get("history")
+            if not history:
+                return self.check_time_interval_in_seconds
+            headroom = self.get_watermarks(database_connection)[0] - history[-1][1]
+            if headroom <= 0:
+                return self.min_check_time_interval_in_seconds
+            rate = self.get_xid_rate(history)
+            if rate is None:
+                interval = self.check_time_interval_in_seconds
+            elif rate > 0:
+
+                # Leave time for several checks before the low watermark could be reached.
+
+                interval = headroom / rate / self.adaptive_checks_before_low_watermark
+            else:
+                interval = self.max_check_time_interval_in_seconds
+            result = min(result, interval)
+
+        return min(max(result, self.min_check_time_interval_in_seconds), self.max_check_time_interval_in_seconds)
+
+    def schedule_next_check(self):
+        """
+        Set when the next check happens, by time and by govern() count.
+        The count ("interval") is scaled by the same factor as the time.
+        """
+
+        self.current_check_interval_in_seconds = self.get_next_check_interval()
+        scale = self.current_check_interval_in_seconds / max(self.check_time_interval_in_seconds, 1e-9)
+        self.current_interval = max(1, int(self.interval * scale))
+        self.next_check_time = self.clock() + self.current_check_interval_in_seconds
+
+    def read_shared_snapshot(self):
+        """
+        Subscriber side: return the latest snapshot published by another process.
+        Returns None when the publisher never finished writing it; the caller then checks the databases itself.
+        """
+
+        if self.shared_snapshot is None:
+
+            # The publisher may not have started yet.  Retry once per check interval.
+
+            if self.clock() <= self.next_check_time:
+                return self.snapshot
+            self.next_check_time = self.clock() + self.check_time_interval_in_seconds
+            try:
+                self.shared_snapshot = SharedSnapshot(self.shared_memory_name)
+            except FileNotFoundError:
+                return self.snapshot
+
+        # Only unpack the whole snapshot when the publisher has written a new one.
+
+        sequence = self.shared_snapshot.sequence()
+        if sequence != self.shared_sequence:
+            result = self.shared_snapshot.read()
+            if result is None:
+                return None
+            self.shared_sequence, self.snapshot = result
+        return self.snapshot
+
+    # -------------------------------------------------------------------------
+    # Background sampler.
+    # -------------------------------------------------------------------------
+
+    def start_sampler(self):
+        """Start a daemon thread that checks the databases off the govern() path."""
+
+        self.sampler_stop_event = threading.Event()
+        self.sampler_thread = threading.Thread(target=self.run_sampler, name="senzing-governor-sampler", daemon=True)
+        self.sampler_thread.start()
+        logger.info(
+            "senzing-{0}0009I Governor background sampler started. Check interval: {1} seconds".format(
+                SENZING_PRODUCT_ID, self.check_time_interval_in_seconds
+            )
+        )
+
+    def run_sampler(self):
+        """Body of the sampler thread.  Publishes a new snapshot after each check."""
+
+        while not self.sampler_stop_event.is_set():
+            try:
+                if self.profiling:
+                    self.publish_snapshot(self.profile_call(self.check_databases))
+                else:
+                    self.publish_snapshot(self.check_databases())
+            except Exception as err:
+                logger.warning(
+                    "senzing-{0}0702W Governor background sampler failed to check databases. Error: {1}".format(
+                        SENZING_PRODUCT_ID, err
+                    )
+                )
+            self.flush_log()
+            self.sampler_stop_event.wait(self.current_check_interval_in_seconds)
+
+    def stop_sampler(self):
+        if self.sampler_thread is None:
+            return
+        self.sampler_stop_event.set()
+        self.sampler_thread.join()
+        self.sampler_thread = None
+
+    # -------------------------------------------------------------------------
+    # Logging.
+    # -------------------------------------------------------------------------
+
+    def log_info(self, format_string, *args):
+        """
+        Log a governor message made during a check.  format_string uses %-style placeholders.
+        The message is only queued here: flush_log() formats and emits it once the check has released its lock,
+        so how long a check holds the lock does not depend on how logging is configured.
+        """
+
+        self.pending_log_messages.append((logging.INFO, format_string, args))
+
+    def log_warning(self, format_string, *args):
+        """Same as log_info(), at the WARNING level."""
+
+        self.pending_log_messages.append((logging.WARNING, format_string, args))
+
+    def flush_log(self):
+        """Emit the messages queued by log_info() and log_warning().  With profiling, the time taken is recorded."""
+
+        if not self.pending_log_messages:
+            return
+        start_time = time.perf_counter() if self.profiling else 0.0
+        while True:
+            try:
+                level, format_string, args = self.pending_log_messages.popleft()
+            except IndexError:
+                break
+            if logger.isEnabledFor(level):
+                logger.log(level, format_string, *args, extra={"governor_args": args})
+        if self.profiling:
+            self.add_profile_phase("logging", time.perf_counter() - start_time)
+
+    # -------------------------------------------------------------------------
+    # Profiling.
+    # -------------------------------------------------------------------------
+
+    def start_profiling(self):
+        """
+        Record the latency of every govern() call.
+        govern() then goes through govern_wrapped(); without profiling it costs one flag check.
+        """
+
+        self.profile_buffer = [None] * self.profile_buffer_size
+        self.profile_index = itertools.count()
+        self.profiling = True
+        self.wrap_govern = True
+
+    def add_profile_phase(self, phase, seconds):
+        phases = profile_phases.get()
+        if phases is not None:
+            phases[phase] = phases.get(phase, 0.0) + seconds
+
+    def record_profile(self, timestamp, total, phases):
+        """Write one ProfileRecord to the ring buffer.  The slot comes from an atomic counter, so no lock is needed."""
+
+        self.profile_buffer[next(self.profile_index) % self.profile_buffer_size] = ProfileRecord(
+            timestamp,
+            threading.current_thread().name,
+            total,
+            phases.get("lock", 0.0),
+            phases.get("probe", 0.0),
+            phases.get("evaluate", 0.0),
+            phases.get("logging", 0.0),
+        )
+
+    def profile_call(self, function, *args, **kwargs):
+        """Call function, recording its total time and the phases it reports."""
+
+        timestamp = time.time()
+        token = profile_phases.set({})
+        try:
+            start_time = time.perf_counter()
+            result = function(*args, **kwargs)
+            total = time.perf_counter() - start_time
+            self.record_profile(timestamp, total, profile_phases.get())
+        finally:
+            profile_phases.reset(token)
+        return result
+
+    def dump_profile(self, output_file=None):
+        """
+        Return the ProfileRecords in the ring buffer, oldest first.
+        If output_file is given, also write them to it as CSV.
+        """
+
+        if not self.profiling:
+            return []
+        result = sorted(
+            (record for record in list(self.profile_buffer) if record is not None), key=lambda record: record[0]
+        )
+        if output_file is not None:
+            output_file.write(",".join(ProfileRecord._fields) + "\n")
+            for record in result:
+                output_file.write(",".join(str(value) for value in record) + "\n")
+        return result
+
+    # -------------------------------------------------------------------------
+    # Metrics.
+    # -------------------------------------------------------------------------
+
+    def render_metrics(self):
+        """Pull API: current metrics in the Prometheus text exposition format."""
+
+        if self.metrics is None:
+            return ""
+        return self.metrics.render(*self.get_govern_counts())
+
+    def start_metrics_server(self):
+        import http.server  # pylint: disable=import-outside-toplevel
+
+        self.metrics_server = http.server.ThreadingHTTPServer(
+            (self.metrics_host, self.metrics_port), get_metrics_request_handler()
+        )
+        self.metrics_server.daemon_threads = True
+        self.metrics_server.governor = self
+        self.metrics_port = self.metrics_server.server_address[1]
+        threading.Thread(target=self.metrics_server.serve_forever, name="senzing-governor-metrics", daemon=True).start()
+        logger.info(
+            "senzing-{0}0012I Governor metrics available at http://{1}:{2}/metrics".format(
+                SENZING_PRODUCT_ID, self.metrics_host, self.metrics_port
+            )
+        )
+
+    def stop_metrics_server(self):
+        if self.metrics_server is None:
+            return
+        self.metrics_server.shutdown()
+        self.metrics_server.server_close()
+        self.metrics_server = None
+
+    # -------------------------------------------------------------------------
+    # Serving wait times.
+    # -------------------------------------------------------------------------
+
+    def start_server(self):
+        """
+        Serve the wait time to RemoteGovernors at server_address.
+        The databases are checked by the background sampler, so requests never wait for a probe.
+        """
+
+        import socket  # pylint: disable=import-outside-toplevel
+        import socketserver  # pylint: disable=import-outside-toplevel
+
+        family, address = parse_server_address(self.server_address)
+        if family == socket.AF_UNIX:
+            if os.path.exists(address):
+                os.unlink(address)
+            self.server = socketserver.UnixDatagramServer(address, handle_remote_request)
+        else:
+            self.server = socketserver.UDPServer(address, handle_remote_request)
+            self.server_address = "udp://{0}:{1}".format(*self.server.server_address[:2])
+        self.server.governor = self
+        threading.Thread(target=self.server.serve_forever, name="senzing-governor-server", daemon=True).start()
+        if self.sampler_thread is None and not self.subscriber:
+            self.start_sampler()
+        logger.info(
+            "senzing-{0}0021I Governor serving wait times at {1}".format(SENZING_PRODUCT_ID, self.server_address)
+        )
+
+    def stop_server(self):
+        import socket  # pylint: disable=import-outside-toplevel
+
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        family, address = parse_server_address(self.server_address)
+        if family == socket.AF_UNIX and os.path.exists(address):
+            os.unlink(address)
+        self.server = None
+
+    def get_remote_response(self, request):
+        """The answer to a RemoteGovernor request; see handle_remote_request()."""
+
+        snapshot = (self.read_shared_snapshot() if self.subscriber else None) or self.snapshot
+        wait_time = snapshot.wait_time
+        if request.get("database") is not None:
+            wait_time = self.get_database_wait_time(request.get("database"), wait_time)
+        return {
+            "id": request.get("id"),
+            "wait_time": float(wait_time),
+            "database": getattr(wait_time, "database", None),
+            "age": self.clock() - snapshot.sample_time,
+            "max_batch_wait": self.get_max_batch_wait_time(),
+        }
+
+    # -------------------------------------------------------------------------
+    # Construction.
+    # -------------------------------------------------------------------------
+
+    def __init__(
+        self,
+        database_urls=None,
+        high_watermark=1_500_000_000,
+        hint="",
+        interval=100_000,
+        list_separator=",",
+        low_watermark=1_200_000_000,
+        log_interval_in_seconds=600,
+        check_time_interval_in_seconds=5,
+        background_sampler=False,
+        probe_strategy="fast",
+        probe_timeout_in_seconds=10,
+        shared_memory_name=None,
+        shared_memory_role="publisher",
+        unreachable_policy="fail-open",
+        stale_reading_max_age_in_seconds=60,
+        reconnect_min_delay_in_seconds=1,
+        reconnect_max_delay_in_seconds=60,
+        predictive_horizon_in_seconds=0,
+        trend_history_size=60,
+        wait_strategy="step",
+        adaptive_check_interval=False,
+        min_check_time_interval_in_seconds=1,
+        max_check_time_interval_in_seconds=60,
+        metrics=False,
+        metrics_host="127.0.0.1",
+        metrics_port=0,
+        profile=False,
+        profile_buffer_size=65536,
+        clock=None,
+        probe=None,
+        token_bucket_records_per_second=0,
+        token_bucket_burst_in_seconds=1.0,
+        priorities="",
+        vacuum_advisory=False,
+        vacuum_freeze=False,
+        vacuum_top_n=5,
+        vacuum_cost_delay_in_milliseconds=2,
+        vacuum_cost_limit=200,
+        vacuum_min_interval_in_seconds=600,
+        probe_database_urls=None,
+        share_probe_connections=False,
+        standby_max_lag_in_seconds=60,
+        warm_up=False,
+        signal_watermarks=None,
+        database_watermarks=None,
+        config_file=None,
+        server_address=None,
+        log_queue=False,
+        log_format=None,
+        max_batch_wait_in_seconds=None,
+        *args,
+        **kwargs,
+    ):
+
+        self.setup_logging(log_queue, log_format)
+        logger.info(
+            "senzing-{0}0001I Using governor-postgresql-transaction-id Governor. Version: {1} Updated: {2}".format(
+                SENZING_PRODUCT_ID, __version__, __updated__
+            )
+        )
+
+        # Instance variables. Precedence: 1) OS Environment variables, 2) parameters
+        self.old_wait_time = WaitTime(0.0)
+        self.database_wait_times = {}
+        self.last_log_time = 0
+        self.wait_strategy = self.make_wait_strategy(os.getenv("SENZING_GOVERNOR_WAIT_STRATEGY", wait_strategy))
+        # update this data structure to change the back-off step times.
+        #  1.0 means that we're at the highwater mark so we should pause longer
+        #  to allow the database to catch up.  More steps could be added or times
+        #  modified to fit required performance characteristics.
+        # <ratio>:<time in seconds>
+        self.step_ratios = [
+            (1.0, -1.0),
+            (0.9, 9.0),
+            (0.8, 6.0),
+            (0.7, 4.0),
+            (0.6, 2.0),
+            (0.5, 1.0),
+            (0.4, 0.7),
+            (0.3, 0.5),
+            (0.2, 0.2),
+            (0.1, 0.1),
+            (0.0, 0.0),
+        ]
+
+        # Database connection strings are resolved and parsed by load_database_connections(),
+        # on first use or by the SENZING_GOVERNOR_WARM_UP thread, so construction stays cheap.
+
+        self.database_urls = None
+        self.database_urls_parameter = database_urls
+        self.config_database_urls = None
+        self.database_connections_loaded = False
+        self.database_connections_lock = threading.Lock()
+        self.monitored_database_connections = {}
+
+        self.hint = os.getenv("SENZING_GOVERNOR_HINT", hint)
+        self.list_separator = os.getenv("SENZING_GOVERNOR_LIST_SEPARATOR", list_separator)
+        self.clock = clock or time.time
+        self.setup_counting(interval, max_batch_wait_in_seconds)
+        self.setup_watermarks(high_watermark, low_watermark, database_watermarks, signal_watermarks)
+        self.setup_probing(
+            probe_strategy,
+            probe_timeout_in_seconds,
+            unreachable_policy,
+            stale_reading_max_age_in_seconds,
+            reconnect_min_delay_in_seconds,
+            reconnect_max_delay_in_seconds,
+            probe,
+            probe_database_urls,
+            share_probe_connections,
+            standby_max_lag_in_seconds,
+        )
+        self.setup_check_timing(
+            check_time_interval_in_seconds,
+            predictive_horizon_in_seconds,
+            trend_history_size,
+            adaptive_check_interval,
+            min_check_time_interval_in_seconds,
+            max_check_time_interval_in_seconds,
+        )
+        self.metrics_port = int(os.getenv("SENZING_GOVERNOR_METRICS_PORT", metrics_port))
+        self.metrics_host = os.getenv("SENZING_GOVERNOR_METRICS_HOST", metrics_host)
+        self.metrics = None
+        if str_to_bool(os.getenv("SENZING_GOVERNOR_METRICS", metrics)) or self.metrics_port:
+            self.metrics = GovernorMetrics()
+        self.profiling = False
+        self.wrap_govern = False
+        self.profile_buffer_size = int(os.getenv("SENZING_GOVERNOR_PROFILE_BUFFER_SIZE", profile_buffer_size))
+        self.log_interval_in_seconds = int(
+            os.getenv("SENZING_GOVERNOR_LOG_INTERVAL_IN_SECONDS", log_interval_in_seconds)
+        )
+        self.background_sampler = str_to_bool(os.getenv("SENZING_GOVERNOR_BACKGROUND_SAMPLER", background_sampler))
+        logger.info(
+            "senzing-{0}0002I SENZING_GOVERNOR_POSTGRESQL_HIGH_WATERMARK: {1}; SENZING_GOVERNOR_INTERVAL: {2}; SENZING_GOVERNOR_POSTGRESQL_LOW_WATERMARK {3}; SENZING_GOVERNOR_HINT: {4}; SENZING_GOVERNOR_LOG_INTERVAL_IN_SECONDS: {5}".format(
+                SENZING_PRODUCT_ID,
+                self.high_watermark,
+                self.interval,
+                self.low_watermark,
+                self.hint,
+                self.log_interval_in_seconds,
+            )
+        )
+
+        # Synthesize variables.
+
+        self.snapshot = GovernorSnapshot(0.0, 0, None, None, 0.0)
+        self.sampler_thread = None
+        self.probe_executor = None
+        self.probe_executor_size = 0
+        self.connect_executor = None
+        self.metrics_server = None
+        self.server = None
+        self.server_address = os.getenv("SENZING_GOVERNOR_SERVER_ADDRESS", server_address)
+        self.setup_shared_memory(shared_memory_name, shared_memory_role)
+
+        # Optionally read settings from a file, and re-read them when it changes.
+
+        self.config_file = os.getenv("SENZING_GOVERNOR_CONFIG_FILE", config_file)
+        self.config_file_modified_time = None
+        self.config_reload_requested = False
+        self.reload_config_if_changed()
+        self.flush_log()
+
+        self.setup_vacuum_advisor(
+            vacuum_advisory,
+            vacuum_freeze,
+            vacuum_top_n,
+            vacuum_cost_delay_in_milliseconds,
+            vacuum_cost_limit,
+            vacuum_min_interval_in_seconds,
+        )
+        self.setup_token_bucket(token_bucket_records_per_second, token_bucket_burst_in_seconds, priorities)
+        self.start_services(profile, warm_up)
+
+    def setup_logging(self, log_queue, log_format):
+        """
+        Optionally write governor messages as JSON, and from a background thread.
+        Left alone unless asked for, as the logging configuration is shared by the whole process.
+        """
+
+        self.pending_log_messages = collections.deque()
+        self.log_queue = str_to_bool(os.getenv("SENZING_GOVERNOR_LOG_QUEUE", log_queue))
+        self.log_format = os.getenv("SENZING_GOVERNOR_LOG_FORMAT", log_format)
+        if self.log_format is not None:
+            self.log_format = self.log_format.lower()
+            if self.log_format not in LOG_FORMATS:
+                logger.warning(
+                    "senzing-{0}0717W SENZING_GOVERNOR_LOG_FORMAT of {1} is not one of {2}. Using 'text'.".format(
+                        SENZING_PRODUCT_ID, self.log_format, LOG_FORMATS
+                    )
+                )
+                self.log_format = "text"
+        if self.log_queue or self.log_format is not None:
+            configure_logging(self.log_queue, self.log_format or "text")
+
+    def setup_counting(self, interval, max_batch_wait_in_seconds):
+        """Counting of govern() calls and batches; every "interval"-th record checks the databases."""
+
+        self.interval = int(os.getenv("SENZING_GOVERNOR_INTERVAL", interval))
+        self.current_interval = self.interval
+        self.counter_lock = threading.Lock()
+        self.ticket_lock = threading.Lock()
+        self.tickets = itertools.count(1)
+        self.batch_calls = 0
+        self.batch_records = 0
+        self.max_batch_wait_in_seconds = os.getenv(
+            "SENZING_GOVERNOR_MAX_BATCH_WAIT_IN_SECONDS", max_batch_wait_in_seconds
+        )
+        if self.max_batch_wait_in_seconds is not None:
+            self.max_batch_wait_in_seconds = float(self.max_batch_wait_in_seconds)
+
+    def setup_watermarks(self, high_watermark, low_watermark, database_watermarks, signal_watermarks):
+        """The Governor's watermarks, and those of individual databases and signals."""
+
+        self.high_watermark = int(os.getenv("SENZING_GOVERNOR_POSTGRESQL_HIGH_WATERMARK", high_watermark))
+        self.low_watermark = int(os.getenv("SENZING_GOVERNOR_POSTGRESQL_LOW_WATERMARK", low_watermark))
+        self.database_watermarks = {
+            database_name: (int(low), int(high))
+            for database_name, (low, high) in parse_watermarks(
+                os.getenv("SENZING_GOVERNOR_DATABASE_WATERMARKS", database_watermarks), self.list_separator
+            ).items()
+        }
+        self.signal_watermarks = parse_signal_watermarks(
+            os.getenv("SENZING_GOVERNOR_SIGNAL_WATERMARKS", signal_watermarks), self.list_separator, self.log_warning
+        )
+
+    def setup_probing(
+        self,
+        probe_strategy,
+        probe_timeout_in_seconds,
+        unreachable_policy,
+        stale_reading_max_age_in_seconds,
+        reconnect_min_delay_in_seconds,
+        reconnect_max_delay_in_seconds,
+        probe,
+        probe_database_urls,
+        share_probe_connections,
+        standby_max_lag_in_seconds,
+    ):
+        """How databases are probed, and what happens when they cannot be."""
+
+        self.probe = probe
+        self.probe_strategy = os.getenv("SENZING_GOVERNOR_PROBE_STRATEGY", probe_strategy).lower()
+        if self.probe_strategy not in ["fast", "detailed", "signals"]:
+            logger.warning(
+                "senzing-{0}0703W SENZING_GOVERNOR_PROBE_STRATEGY of {1} is not one of 'fast', 'detailed' or 'signals'. Using 'fast'.".format(
+                    SENZING_PRODUCT_ID, self.probe_strategy
+                )
+            )
+            self.probe_strategy = "fast"
+        self.probe_timeout_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_PROBE_TIMEOUT_IN_SECONDS", probe_timeout_in_seconds)
+        )
+        self.unreachable_policy = os.getenv("SENZING_GOVERNOR_UNREACHABLE_POLICY", unreachable_policy).lower()
+        if self.unreachable_policy not in ["fail-open", "fail-closed"]:
+            logger.warning(
+                "senzing-{0}0707W SENZING_GOVERNOR_UNREACHABLE_POLICY of {1} is not one of 'fail-open' or 'fail-closed'. Using 'fail-open'.".format(
+                    SENZING_PRODUCT_ID, self.unreachable_policy
+                )
+            )
+            self.unreachable_policy = "fail-open"
+        self.stale_reading_max_age_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_STALE_READING_MAX_AGE_IN_SECONDS", stale_reading_max_age_in_seconds)
+        )
+        self.reconnect_min_delay_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_RECONNECT_MIN_DELAY_IN_SECONDS", reconnect_min_delay_in_seconds)
+        )
+        self.reconnect_max_delay_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_RECONNECT_MAX_DELAY_IN_SECONDS", reconnect_max_delay_in_seconds)
+        )
+        self.probe_database_urls = os.getenv("SENZING_GOVERNOR_PROBE_DATABASE_URLS", probe_database_urls)
+        self.share_probe_connections = str_to_bool(
+            os.getenv("SENZING_GOVERNOR_SHARE_PROBE_CONNECTIONS", share_probe_connections)
+        )
+        self.standby_max_lag_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_STANDBY_MAX_LAG_IN_SECONDS", standby_max_lag_in_seconds)
+        )
+
+    def setup_check_timing(
+        self,
+        check_time_interval_in_seconds,
+        predictive_horizon_in_seconds,
+        trend_history_size,
+        adaptive_check_interval,
+        min_check_time_interval_in_seconds,
+        max_check_time_interval_in_seconds,
+    ):
+        """When databases are checked, and how far ahead the age trend is followed."""
+
+        self.check_time_interval_in_seconds = int(
+            os.getenv("SENZING_GOVERNOR_CHECK_TIME_INTERVAL_IN_SECONDS", check_time_interval_in_seconds)
+        )
+        self.next_check_time = self.clock() + self.check_time_interval_in_seconds
+        self.current_check_interval_in_seconds = self.check_time_interval_in_seconds
+        self.predictive_horizon_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_PREDICTIVE_HORIZON_IN_SECONDS", predictive_horizon_in_seconds)
+        )
+        self.trend_history_size = int(os.getenv("SENZING_GOVERNOR_TREND_HISTORY_SIZE", trend_history_size))
+        self.adaptive_check_interval = str_to_bool(
+            os.getenv("SENZING_GOVERNOR_ADAPTIVE_CHECK_INTERVAL", adaptive_check_interval)
+        )
+        self.min_check_time_interval_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_MIN_CHECK_TIME_INTERVAL_IN_SECONDS", min_check_time_interval_in_seconds)
+        )
+        self.max_check_time_interval_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_MAX_CHECK_TIME_INTERVAL_IN_SECONDS", max_check_time_interval_in_seconds)
+        )
+        self.adaptive_checks_before_low_watermark = 10
+
+        # Bounds for the predictive wait time; see get_predictive_wait_time().
+
+        self.predictive_min_wait_in_seconds = 0.01
+        self.predictive_max_wait_in_seconds = max(step[1] for step in self.step_ratios)
+
+    def setup_shared_memory(self, shared_memory_name, shared_memory_role):
+        """
+        Optionally share snapshots with other processes.
+        A subscriber makes no database connections; it reads what the publisher writes.
+        """
+
+        self.shared_memory_name = os.getenv("SENZING_GOVERNOR_SHARED_MEMORY_NAME", shared_memory_name)
+        self.shared_memory_role = os.getenv("SENZING_GOVERNOR_SHARED_MEMORY_ROLE", shared_memory_role).lower()
+        self.shared_snapshot = None
+        self.shared_sequence = 0
+        self.subscriber = False
+        if self.shared_memory_name:
+            if self.shared_memory_role == "subscriber":
+                self.subscriber = True
+                self.next_check_time = 0
+            else:
+                self.shared_memory_role = "publisher"
+                self.shared_snapshot = SharedSnapshot(self.shared_memory_name, create=True)
+            logger.info(
+                "senzing-{0}0010I Governor is a shared memory {1}. SENZING_GOVERNOR_SHARED_MEMORY_NAME: {2}".format(
+                    SENZING_PRODUCT_ID, self.shared_memory_role, self.shared_memory_name
+                )
+            )
+
+    def setup_vacuum_advisor(
+        self,
+        vacuum_advisory,
+        vacuum_freeze,
+        vacuum_top_n,
+        vacuum_cost_delay_in_milliseconds,
+        vacuum_cost_limit,
+        vacuum_min_interval_in_seconds,
+    ):
+        """Optionally list, and freeze, the oldest relations when above the low watermark."""
+
+        self.vacuum_advisor = None
+        self.vacuum_freeze = str_to_bool(os.getenv("SENZING_GOVERNOR_VACUUM_FREEZE", vacuum_freeze))
+        if self.vacuum_freeze or str_to_bool(os.getenv("SENZING_GOVERNOR_VACUUM_ADVISORY", vacuum_advisory)):
+            self.vacuum_advisor = VacuumAdvisor(
+                self.connect_vacuum_database,
+                lambda database_connection: self.get_watermarks(database_connection)[0],
+                freeze=self.vacuum_freeze,
+                top_n=int(os.getenv("SENZING_GOVERNOR_VACUUM_TOP_N", vacuum_top_n)),
+                cost_delay_in_milliseconds=float(
+                    os.getenv("SENZING_GOVERNOR_VACUUM_COST_DELAY_IN_MILLISECONDS", vacuum_cost_delay_in_milliseconds)
+                ),
+                cost_limit=int(os.getenv("SENZING_GOVERNOR_VACUUM_COST_LIMIT", vacuum_cost_limit)),
+                min_interval_in_seconds=float(
+                    os.getenv("SENZING_GOVERNOR_VACUUM_MIN_INTERVAL_IN_SECONDS", vacuum_min_interval_in_seconds)
+                ),
+                clock=self.clock,
+                log_info=self.log_info,
+            )
+
+    def setup_token_bucket(self, token_bucket_records_per_second, token_bucket_burst_in_seconds, priorities):
+        """Optionally hand out a records/sec budget instead of one wait time for everyone."""
+
+        self.token_bucket_records_per_second = float(
+            os.getenv("SENZING_GOVERNOR_TOKEN_BUCKET_RECORDS_PER_SECOND", token_bucket_records_per_second)
+        )
+        self.token_bucket_burst_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_TOKEN_BUCKET_BURST_IN_SECONDS", token_bucket_burst_in_seconds)
+        )
+        self.priorities = parse_priorities(os.getenv("SENZING_GOVERNOR_PRIORITIES", priorities), self.list_separator)
+        self.token_shaper = None
+        self.records_budget = None
+        if self.token_bucket_records_per_second > 0:
+            self.token_shaper = TokenBucketShaper(
+                self.priorities, self.token_bucket_burst_in_seconds, self.wait_strategy.max_wait_time
+            )
+            self.wrap_govern = True
+
+    def start_services(self, profile, warm_up):
+        """Start what the settings ask for, once everything else is set up."""
+
+        # Optionally time every govern() call.
+
+        if str_to_bool(os.getenv("SENZING_GOVERNOR_PROFILE", profile)):
+            self.start_profiling()
+
+        # Optionally move database checks to a background thread.
+
+        if self.background_sampler and not self.subscriber:
+            self.start_sampler()
+
+        # Optionally serve metrics over HTTP.
+
+        if self.metrics_port:
+            self.start_metrics_server()
+
+        # Optionally serve wait times to RemoteGovernors.
+
+        if self.server_address:
+            self.start_server()
+
+        # Optionally parse database URLs and connect in the background, ahead of the first check.
+
+        if str_to_bool(os.getenv("SENZING_GOVERNOR_WARM_UP", warm_up)):
+            self.warm_up()
+
+    @property
+    def step_ratios(self):
+        return self.wait_strategy.step_ratios
+
+    @step_ratios.setter
+    def step_ratios(self, step_ratios):
+        self.wait_strategy.set_step_ratios(step_ratios)
+
+    @property
+    def database_connections(self):
+        """Bookkeeping for each monitored database, keyed by URL.  Loaded on first use."""
+
+        if not self.database_connections_loaded:
+            self.load_database_connections()
+        return self.monitored_database_connections
+
+    def make_wait_strategy(self, wait_strategy):
+        """wait_strategy is a WaitStrategy instance or one of the names in WAIT_STRATEGIES."""
+
+        if isinstance(wait_strategy, WaitStrategy):
+            return wait_strategy
+        wait_strategy_class = WAIT_STRATEGIES.get(str(wait_strategy).lower())
+        if wait_strategy_class is None:
+            logger.warning(
+                "senzing-{0}0708W SENZING_GOVERNOR_WAIT_STRATEGY of {1} is not one of {2}. Using 'step'.".format(
+                    SENZING_PRODUCT_ID, wait_strategy, sorted(WAIT_STRATEGIES)
+                )
+            )
+            wait_strategy_class = StepWaitStrategy
+        return wait_strategy_class()
+
+    def get_wait_time(self, watermark, low_watermark=None, high_watermark=None):
+        """
+        There are several strategies one could use for determining wait time.
+        The default is a static step function.  Others, selected by
+        SENZING_GOVERNOR_WAIT_STRATEGY, are a linear or exponential backoff
+        and a smoothed step function that ramps up wait time between stepped
+        ranges.  See WAIT_STRATEGIES.
+        low_watermark and high_watermark default to the Governor's.
+        """
+
+        if low_watermark is None:
+            low_watermark = self.low_watermark
+        if high_watermark is None:
+            high_watermark = self.high_watermark
+        watermark_ratio = (watermark - low_watermark) / (high_watermark - low_watermark)
+        return self.wait_strategy.get_wait_time(watermark_ratio)
+
+    def get_watermarks(self, database_connection):
+        """
+        (low, high) watermarks of one database: its SENZING_GOVERNOR_DATABASE_WATERMARKS entry or the Governor's.
+        An entry for the database's URL wins over one for its database name,
+        so databases of the same name on different hosts can differ.
+        """
+
+        watermarks = self.database_watermarks.get(database_connection.get("database_url"))
+        if watermarks is None:
+            database_name = database_connection.get("parsed_database_url", {}).get("dbname")
+            watermarks = self.database_watermarks.get(database_name, (self.low_watermark, self.high_watermark))
+        return watermarks
+
+    def get_wait_times(self, watermarks):
+        """
+        Same as get_wait_time() for many watermarks at once, e.g. to tune a strategy
+        against historical ages.  Returns a numpy array when numpy is installed.
+        """
+
+        numpy = import_numpy()
+        watermark_delta = self.high_watermark - self.low_watermark
+        if numpy is None:
+            watermark_ratios = [(watermark - self.low_watermark) / watermark_delta for watermark in watermarks]
+        else:
+            watermark_ratios = (numpy.asarray(watermarks, dtype=float) - self.low_watermark) / watermark_delta
+        return self.wait_strategy.get_wait_times(watermark_ratios)
 
-        self.database_urls = database_urls
-        self.database_urls = self.extract_database_urls(
-            os.getenv("SENZING_ENGINE_CONFIGURATION_JSON"), self.database_urls
-        )
-        self.database_urls = os.getenv("SENZING_DATABASE_URL", self.database_urls)
-        self.database_urls = os.getenv("SENZING_GOVERNOR_DATABASE_URLS", self.database_urls)
+    def get_xid_rate(self, history):
+        """
+        Least-squares slope of age over time for the (timestamp, age) samples in history.
+        Returns XIDs consumed per second, or None if there is not enough history.
+        """
 
-        self.high_watermark = int(os.getenv("SENZING_GOVERNOR_POSTGRESQL_HIGH_WATERMARK", high_watermark))
-        self.hint = os.getenv("SENZING_GOVERNOR_HINT", hint)
-        self.interval = int(os.getenv("SENZING_GOVERNOR_INTERVAL", interval))
-        self.list_separator = os.getenv("SENZING_GOVERNOR_LIST_SEPARATOR", list_separator)
-        self.low_watermark = int(os.getenv("SENZING_GOVERNOR_POSTGRESQL_LOW_WATERMARK", low_watermark))
-        self.sql_stmt = "SELECT c.oid::regclass, age(c.relfrozenxid), pg_size_pretty(pg_total_relation_size(c.oid)) FROM pg_class c JOIN pg_namespace n on c.relnamespace = n.oid WHERE relkind IN ('r', 't', 'm') AND n.nspname NOT IN ('pg_toast') ORDER BY 2 DESC LIMIT 1;"
-        self.check_time_interval_in_seconds = int(
-            os.getenv("SENZING_GOVERNOR_CHECK_TIME_INTERVAL_IN_SECONDS", check_time_interval_in_seconds)
-        )
-        self.log_interval_in_seconds = int(
-            os.getenv("SENZING_GOVERNOR_LOG_INTERVAL_IN_SECONDS", log_interval_in_seconds)
-        )
-        logging.info(
-            "senzing-{0}0002I SENZING_GOVERNOR_POSTGRESQL_HIGH_WATERMARK: {1}; SENZING_GOVERNOR_INTERVAL: {2}; SENZING_GOVERNOR_POSTGRESQL_LOW_WATERMARK {3}; SENZING_GOVERNOR_HINT: {4}; SENZING_GOVERNOR_LOG_INTERVAL_IN_SECONDS: {5}".format(
-                SENZING_PRODUCT_ID,
-                self.high_watermark,
-                self.interval,
-                self.low_watermark,
-                self.hint,
-                self.log_interval_in_seconds,
-            )
-        )
+        if len(history) < 2:
+            return None
+        count = len(history)
+        mean_time = sum(sample[0] for sample in history) / count
+        mean_age = sum(sample[1] for sample in history) / count
+        variance = sum((sample[0] - mean_time) ** 2 for sample in history)
+        if variance == 0:
+            return None
+        covariance = sum((sample[0] - mean_time) * (sample[1] - mean_age) for sample in history)
+        return covariance / variance
+
+    def get_predictive_wait_time(self, database_connection, watermark):
+        """
+        Choose a wait time from the trend of the XID age instead of its position between watermarks.
+        From the recent consumption rate, project how long until the high watermark is reached.
+        If that is sooner than predictive_horizon_in_seconds, lengthen the wait; if later, shorten it.
+        Each new sample changes the wait by at most a factor of 2, so throughput moves smoothly
+        towards the rate that keeps the projection at the horizon.
+        Above the high watermark the step function's emergency value still applies.
+        """
 
-        # Synthesize variables.
+        low_watermark, high_watermark = self.get_watermarks(database_connection)
+        if watermark > high_watermark:
+            return self.get_wait_time(watermark, low_watermark, high_watermark)
+
+        # Only adjust once per new sample; stale readings re-use the previous decision.
+
+        history = database_connection.get("history") or []
+        previous_wait_time = database_connection.get("predictive_wait_time", 0.0)
+        if not history or history[-1][0] == database_connection.get("predictive_sample_time"):
+            return previous_wait_time
+        database_connection["predictive_sample_time"] = history[-1][0]
 
-        self.next_check_time = time.time() + self.check_time_interval_in_seconds
+        rate = self.get_xid_rate(history)
+        if rate is None or rate <= 0:
+            pressure = 0.0
+        else:
+            seconds_to_high_watermark = max((high_watermark - watermark) / rate, 1e-9)
+            pressure = self.predictive_horizon_in_seconds / seconds_to_high_watermark
 
-        # Make database connections.
+        # pressure > 1 means the high watermark will be reached within the horizon.
 
-        self.database_connections = {}
-        if self.database_urls:
-            sql_connection_strings = self.database_urls.split(self.list_separator)
-            for database_connection_string in sql_connection_strings:
+        if previous_wait_time <= 0:
+            wait_time = self.predictive_min_wait_in_seconds if pressure > 1 else 0.0
+        else:
+            wait_time = previous_wait_time * min(max(pressure, 0.5), 2.0)
+            if wait_time < self.predictive_min_wait_in_seconds:
+                wait_time = 0.0
+        wait_time = min(wait_time, self.predictive_max_wait_in_seconds)
 
-                parsed_database_url = self.parse_database_url(database_connection_string)
+        database_connection["predictive_wait_time"] = wait_time
+        return wait_time
 
-                # Only "postgresql://" databases are monitored.
+    # -------------------------------------------------------------------------
+    # Token bucket rate shaping.
+    # -------------------------------------------------------------------------
 
-                schema = database_connection_string.split(":")[0]
-                if schema != "postgresql":
-                    logging.info(
-                        "senzing-{product_id}0701W SENZING_GOVERNOR_DATABASE_URLS contains a non-postgres URL:  {schema}://{user}:xxxxxxxx@{host}:{port}/{dbname}".format(
-                            product_id=SENZING_PRODUCT_ID, schema=schema, **parsed_database_url
-                        )
-                    )
-                    continue
+    def get_records_budget(self, watermark, low_watermark=None, high_watermark=None):
+        """
+        Records/sec allowed for all callers together, or None for no limit.
+        Below the low watermark there is no limit.  Above it, the budget is
+        token_bucket_records_per_second scaled by the XID headroom left below the high watermark.
+        low_watermark and high_watermark default to the Governor's.
+        """
 
-                # Create connection.
+        if low_watermark is None:
+            low_watermark = self.low_watermark
+        if high_watermark is None:
+            high_watermark = self.high_watermark
+        if watermark <= low_watermark:
+            return None
+        headroom = max(high_watermark - watermark, 0) / max(high_watermark - low_watermark, 1)
+        return self.token_bucket_records_per_second * headroom
 
-                logging.info(
-                    "senzing-{product_id}0003I Governor monitoring {schema}://{user}:xxxxxxxx@{host}:{port}/{dbname}".format(
-                        product_id=SENZING_PRODUCT_ID, schema=schema, **parsed_database_url
-                    )
-                )
-                connection = psycopg2.connect(**parsed_database_url)
-                connection.set_session(autocommit=True, isolation_level="READ UNCOMMITTED", readonly=True)
-                cursor = connection.cursor()
+    def count_batch(self, count):
+        """
+        Count "count" records at once by reserving that many tickets from the govern() counter,
+        so batches and single govern() calls advance one count.
+        Returns True if the tickets reserved include a multiple of "interval".
+        The reservation restarts the counter past the batch under ticket_lock, whatever "count" is.
+        A govern() call racing with it may take a ticket of the batch again, which at worst makes an extra check.
+        """
 
-                self.database_connections[database_connection_string] = {
-                    "parsed_database_url": parsed_database_url,
-                    "connection": connection,
-                    "cursor": cursor,
-                }
+        with self.ticket_lock:
+            first = next(self.tickets)
+            self.tickets = itertools.count(first + count)
+            self.batch_calls += 1
+            self.batch_records += count
+        last = first + count - 1
+        interval = self.current_interval
+        return last // interval > (first - 1) // interval
 
-    def get_wait_time(self, watermark):
+    def get_records_counted(self):
+        """Records counted so far by govern() calls and batches."""
+
+        return self.get_govern_counts()[1]
+
+    def get_govern_counts(self):
         """
-        There are several strategies one could use for determining wait time.
-        We are implementing a static step function.  Another option is to
-        use an exponential (or linear) backoff strategy.  Yet another option is
-        to use a combination of the two where you smoothly ramp up wait time
-        between stepped ranges.
+        (calls, records) counted so far, where a batch is one call of "count" records.
+        Both are read from the ticket counter under ticket_lock, so neither ever goes backwards.
         """
 
-        watermark_delta = self.high_watermark - self.low_watermark
-        watermark_ratio = (watermark - self.low_watermark) / watermark_delta
+        with self.ticket_lock:
+            ticket = next(self.tickets)
+            self.tickets = itertools.count(ticket)
+            records = ticket - 1
+            return records - self.batch_records + self.batch_calls, records
+
+    def get_database_wait_time(self, database, wait_time):
+        """
+        The wait time of one database, by name or URL, as of the last check.
+        Databases that have not been checked, and a shared memory subscriber, get wait_time, the overall wait.
+        """
+
+        return self.database_wait_times.get(database, wait_time)
+
+    def scale_wait_time(self, wait_time, count, database=None):
+        """
+        The wait for "count" records, optionally for one database only; -1.0 is never scaled.
+        A batch waits at most "max_batch_wait_in_seconds", by default the longest wait of the wait strategy.
+        """
+
+        if database is not None:
+            wait_time = self.get_database_wait_time(database, wait_time)
+        if wait_time < 0 or count == 1:
+            return wait_time
+        return WaitTime(min(wait_time * count, self.get_max_batch_wait_time()), getattr(wait_time, "database", None))
+
+    def get_max_batch_wait_time(self):
+        """The longest wait returned for a batch of records."""
+
+        if self.max_batch_wait_in_seconds is None:
+            return self.wait_strategy.max_wait_time
+        return self.max_batch_wait_in_seconds
+
+
+# -----------------------------------------------------------------------------
+# Class: Governor
+# -----------------------------------------------------------------------------
+
 
-        # an example of an exponential backoff strategy would be:
-        # watermark_percentage = watermark_ratio * 100
-        # wait_time = ((1.1**watermark_percentage)-1)/100
+class Governor(GovernorBase):
+    """
+    Checks the databases on the thread of the govern() call that finds a check due,
+    or on a background sampler thread.
+    """
 
-        for step in self.step_ratios:
-            if watermark_ratio > step[0]:
-                return step[1]
+    # -------------------------------------------------------------------------
+    # Support for Python Context Manager.
+    # -------------------------------------------------------------------------
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
 
-        return 0
+    # -------------------------------------------------------------------------
+    # Public API methods.
+    #  - govern()
+    #  - govern_many()
+    #  - close()
+    # -------------------------------------------------------------------------
 
-    def govern(self, *args, **kwargs):
+    def govern(self, *args, count=1, database=None, **kwargs):
         """
         Do the actual "governing".
         Do not return until the governance has been completed.
         The caller of govern() waits synchronously.
+        With count, the call stands for a batch of "count" records; see govern_many().
+        With database, the wait time is only that of the named database; see get_database_wait_time().
+        Returns a WaitTime, whose "database" names the database that caused the wait.
         """
 
-        # counter_lock serializes threads.
+        if self.wrap_govern:
+            return self.govern_wrapped(*args, count=count, database=database, **kwargs)
+        return self.govern_unwrapped(count=count, database=database)
+
+    def govern_wrapped(self, *args, **kwargs):
+        """govern() with the optional extras turned on: profiling and token bucket mode."""
+
+        if self.profiling:
+            return self.profile_call(self.govern_tokens, *args, **kwargs)
+        return self.govern_tokens(*args, **kwargs)
 
-        with self.counter_lock:
-            self.counter += 1
+    def govern_unwrapped(self, *args, count=1, database=None, **kwargs):
+        """govern() itself, without the optional extras."""
 
-            # Only make expensive checks after "interval" records have been read.
+        if count != 1 or database is not None:
+            return self.govern_many(count, database=database)
 
-            if (self.counter % self.interval == 0) or (time.time() > self.next_check_time):
+        # Take a ticket.  next() on itertools.count is atomic under the GIL,
+        # so counting needs no lock.
 
-                # Reset timer and calculated wait time.
+        ticket = next(self.tickets)
 
-                self.next_check_time = time.time() + self.check_time_interval_in_seconds
-                self.old_wait_time = 0.0
+        # A shared memory subscriber only reads what another process published.
 
-                # Go through each database connection to determine if watermark is above high_watermark.
+        if self.subscriber:
+            snapshot = self.read_shared_snapshot()
+            if snapshot is not None:
+                return snapshot.wait_time
 
-                for database_connection in self.database_connections.values():
-                    cursor = database_connection.get("cursor")
-                    database_host = database_connection.get("parsed_database_url", {}).get("host")
-                    database_name = database_connection.get("parsed_database_url", {}).get("dbname")
-                    oid_name, watermark = self.get_current_watermark(cursor)
+        # With a background sampler, the databases are never checked here.
+        # Simply read the most recently published snapshot.
 
-                    current_log_time = time.time()
-                    # only log a message when the log interval has passed
-                    if (current_log_time - self.last_log_time) > self.log_interval_in_seconds:
-                        logging.info(
-                            "senzing-{0}0004I Governor is checking PostgreSQL Transaction IDs. Host: {1}; Database: {2}; Current XID: {3} ({4}); High watermark XID: {5}".format(
-                                SENZING_PRODUCT_ID,
-                                database_host,
-                                database_name,
-                                watermark,
-                                oid_name,
-                                self.high_watermark,
-                            )
-                        )
-                        self.last_log_time = current_log_time
+        if self.sampler_thread is not None:
+            return self.snapshot.wait_time
 
-                    # When we get above the low water mark, use our wait time function to start to slow down.
+        # Only make expensive checks after "interval" records have been read.
+        # Exactly one thread holds each multiple of "interval", so it always checks.
 
-                    if watermark > self.low_watermark:  # This all needs to be done based on the worst XID if all DBs
-                        wait_time = self.get_wait_time(watermark)
+        if ticket % self.current_interval == 0:
+            return self.check_with_counter_lock()
+        if self.clock() > self.next_check_time:
+            return self.check_if_due()
+        return self.old_wait_time
 
-                        # Short-circuit if the the system is in trouble.
+    def govern_tokens(self, *args, count=1, cost=None, hint=None, **kwargs):
+        """
+        govern() in token bucket mode.  The caller is about to process "count" records,
+        costing "cost" tokens (default: count), in priority class "hint" (default: the Governor's hint).
+        Returns the seconds to wait first, or -1.0 when the system is in trouble.
+        Without a token bucket, only the wait time of govern_unwrapped() is returned.
+        """
 
-                        if wait_time < 0:
-                            return -1.0
+        wait_time = self.govern_unwrapped(*args, count=count, **kwargs)
+        if wait_time < 0 or self.token_shaper is None:
+            return wait_time
+        return self.token_shaper.take(count if cost is None else cost, hint or self.hint, self.clock())
 
-                        # Calculate largest wait time.
+    def check_with_counter_lock(self):
+        """
+        Check the databases, waiting for counter_lock, which serializes the checks.
+        Messages made during the check are emitted once counter_lock is released.
+        """
 
-                        current_log_time = time.time()
+        start_time = time.perf_counter() if self.metrics is not None or self.profiling else None
+        try:
+            with self.counter_lock:
+                if start_time is not None:
+                    self.record_lock_wait(time.perf_counter() - start_time)
+                return self.check_and_publish()
+        finally:
+            self.flush_log()
 
-                        # Log a message when the wait_time changes OR if the log interval has passed
+    def check_if_due(self):
+        """
+        When the check time has passed, many threads may notice at once.
+        Only the one that gets counter_lock checks, if the check is still due; the others keep going.
+        """
 
-                        if (wait_time > self.old_wait_time) or (
-                            (current_log_time - self.last_log_time) > self.log_interval_in_seconds
-                        ):
-                            logging.info(
-                                "senzing-{0}0005I Governor suggests waiting {1} seconds for {2} database age(XID) to go from current value of {3} ({4}) to low watermark of {5}.".format(
-                                    SENZING_PRODUCT_ID,
-                                    wait_time,
-                                    database_name,
-                                    watermark,
-                                    oid_name,
-                                    self.low_watermark,
-                                )
-                            )
-                            self.old_wait_time = max(self.old_wait_time, wait_time)
-                            self.last_log_time = current_log_time
-        return self.old_wait_time
+        # Callers must not queue up behind a check in progress, so counter_lock is only tried.
+
+        if not self.counter_lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return self.old_wait_time
+        try:
+            if self.clock() <= self.next_check_time:
+                return self.old_wait_time
+            return self.check_and_publish()
+        finally:
+            self.counter_lock.release()
+            self.flush_log()
+
+    def check_and_publish(self):
+        """Check the databases and publish the snapshot.  The caller holds counter_lock."""
+
+        self.next_check_time = self.clock() + self.check_time_interval_in_seconds
+        self.publish_snapshot(self.check_databases())
+        return self.snapshot.wait_time
+
+    def record_lock_wait(self, lock_wait):
+        if self.metrics is not None:
+            self.metrics.observe_lock_wait(lock_wait)
+        self.add_profile_phase("lock", lock_wait)
+
+    def govern_many(self, count, *args, database=None, **kwargs):
+        """
+        govern() for a batch of "count" records, at the cost of one call.
+        Returns the wait for the whole batch: "count" times the wait of a single record,
+        capped at "max_batch_wait_in_seconds", or -1.0 when the system is in trouble.
+        """
+
+        if count <= 0:
+            return WaitTime(0.0)
+        snapshot = self.read_shared_snapshot() if self.subscriber else None
+        if snapshot is not None:
+            wait_time = snapshot.wait_time
+        elif self.sampler_thread is not None:
+            wait_time = self.snapshot.wait_time
+        elif self.count_batch(count):
+            wait_time = self.check_with_counter_lock()
+        elif self.clock() > self.next_check_time:
+            wait_time = self.check_if_due()
+        else:
+            wait_time = self.old_wait_time
+        return self.scale_wait_time(wait_time, count, database)
 
     def close(self, *args, **kwargs):
         """Tasks to perform when shutting down, e.g., close DB connections"""
 
+        self.stop_server()
+        self.stop_sampler()
+        self.stop_metrics_server()
+        if self.vacuum_advisor is not None:
+            self.vacuum_advisor.close()
+        for executor in [self.probe_executor, self.connect_executor]:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        if self.shared_snapshot is not None:
+            self.shared_snapshot.close()
+            self.shared_snapshot = None
+        for database_connection in self.monitored_database_connections.values():
+            self.disconnect_database(database_connection)
+        self.flush_log()
+        logger.info("senzing-{0}0007I Governor closed.".format(SENZING_PRODUCT_ID))
+
+
+# -----------------------------------------------------------------------------
+# Class: AsyncGovernor
+# -----------------------------------------------------------------------------
+
+
+class AsyncGovernor(GovernorBase):
+    """
+    An asyncio-native Governor for coroutine based callers.
+    Configuration, watermarks and get_wait_time() are the same as Governor.
+    Databases are queried with the psycopg (version 3) asynchronous driver,
+    so govern() never blocks the event loop.
+    Full details on installation: https://www.psycopg.org/psycopg3/docs/basic/install.html
+
+    Example:
+
+        async with AsyncGovernor() as governor:
+            await governor.throttle()
+    """
+
+    def __init__(self, *args, **kwargs):
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        self.connected = False
+        self.check_lock = asyncio.Lock()
+        self.sampler_task = None
+        super().__init__(*args, **kwargs)
+
+    # -------------------------------------------------------------------------
+    # Internal methods for accessing database.
+    # -------------------------------------------------------------------------
+
+    def warm_up(self):
+        """Only parse the database URLs; connections are opened by connect() on the event loop."""
+
+        self.load_database_connections()
+        self.flush_log()
+
+    async def connect(self):
+        """
+        Open a read-only, autocommit connection to each database that has none, all at once, and wait for them.
+        A database that cannot be reached is retried at a later check, backing off as Governor does.
+        """
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        connect_tasks = self.schedule_connects()
+        if connect_tasks:
+            await asyncio.gather(*connect_tasks)
+        self.connected = True
+        self.start_sampler_task()
+
+    def schedule_connects(self):
+        """
+        Start a reconnect_async() task for each database that has no connection,
+        unless one is already running or the database is backing off.
+        Checks do not wait for these; a database still connecting is left to the unreachable policy.
+        Returns the running tasks.
+        """
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        connect_tasks = []
+        if self.probe is not None:
+            return connect_tasks
         for database_connection in self.database_connections.values():
-            database_connection.get("cursor").close()
-            database_connection.get("connection").close()
-        logging.info("senzing-{0}0007I Governor closed.".format(SENZING_PRODUCT_ID))
+            if database_connection.get("cursor") is not None:
+                continue
+            connect_task = database_connection.get("connect_task")
+            if connect_task is None or connect_task.done():
+                if self.clock() < database_connection.get("next_connect_time", 0.0):
+                    continue
+                connect_task = asyncio.create_task(self.reconnect_async(database_connection))
+                database_connection["connect_task"] = connect_task
+            connect_tasks.append(connect_task)
+        return connect_tasks
+
+    async def reconnect_async(self, database_connection):
+        """Same as Governor.reconnect(), on the event loop.  Nothing is done while backing off."""
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        if self.clock() < database_connection.get("next_connect_time", 0.0):
+            return
+        probe_database_url = database_connection.get("probe_database_url")
+        parsed_database_url = probe_database_url or database_connection.get("parsed_database_url", {})
+        try:
+            connection = await asyncio.wait_for(
+                self.new_probe_connection_async(parsed_database_url, read_only_session=probe_database_url is None),
+                timeout=self.probe_timeout_in_seconds,
+            )
+        except Exception as err:
+            self.record_connect_failure(database_connection, parsed_database_url, err)
+            return
+        self.record_connect(database_connection, parsed_database_url, connection, connection.cursor())
+
+    async def new_probe_connection_async(self, parsed_database_url, read_only_session):
+        import psycopg  # pylint: disable=import-outside-toplevel
+
+        connection = await psycopg.AsyncConnection.connect(autocommit=True, **parsed_database_url)
+        if read_only_session:
+            await connection.set_isolation_level(psycopg.IsolationLevel.READ_UNCOMMITTED)
+            await connection.set_read_only(True)
+        return connection
+
+    async def disconnect_database_async(self, database_connection):
+        """Same as Governor.disconnect_database(), awaiting the close.  A connect still running is cancelled."""
+
+        connect_task = database_connection.pop("connect_task", None)
+        if connect_task is not None and not connect_task.done():
+            connect_task.cancel()
+        connection = database_connection.get("connection")
+        database_connection["cursor"] = None
+        database_connection["connection"] = None
+        try:
+            if connection is not None:
+                await connection.close()
+        except Exception:
+            pass
+
+    async def get_current_watermark_async(self, cursor, low_watermark):
+        """Same queries as Governor.get_current_watermark(), awaited."""
+
+        if self.probe_strategy == "fast":
+            await cursor.execute(self.sql_stmt_fast)
+            result = await cursor.fetchone()
+            if result[1] <= low_watermark:
+                return result[0], result[1]
+
+        await cursor.execute(self.sql_stmt)
+        result = await cursor.fetchone()
+        return result[0], result[1]
+
+    async def read_watermark_async(self, database_connection):
+        """(name, age) from the database's cursor, or None when its standby is too far behind."""
+
+        cursor = database_connection.get("cursor")
+        low_watermark = self.get_watermarks(database_connection)[0]
+        if self.probe_strategy == "signals":
+            await cursor.execute(self.sql_stmt_signals, (low_watermark,))
+            return self.read_signals(database_connection, await cursor.fetchone())
+        sql_stmt = self.get_standby_sql_stmt(database_connection)
+        if sql_stmt is None:
+            return await self.get_current_watermark_async(cursor, low_watermark)
+        await cursor.execute(sql_stmt)
+        name, watermark, lag = await cursor.fetchone()
+        if not self.is_standby_current(database_connection, float(lag or 0.0)):
+            return None
+        if sql_stmt == self.sql_stmt_fast_standby and watermark > low_watermark:
+            await cursor.execute(self.sql_stmt)
+            name, watermark = (await cursor.fetchone())[:2]
+        return name, watermark
+
+    async def probe_database_async(self, database_connection):
+        """Same as Governor.probe_database(), awaited."""
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        if self.probe is not None:
+            return self.probe_database(database_connection)
+        if database_connection.get("cursor") is None:
+            return None
+        try:
+            start_time = time.perf_counter()
+            reading = await asyncio.wait_for(
+                self.read_watermark_async(database_connection), timeout=self.probe_timeout_in_seconds
+            )
+        except asyncio.TimeoutError:
+            self.log_warning(
+                "senzing-%s0704W Governor probe of %s database did not complete within %s seconds.",
+                SENZING_PRODUCT_ID,
+                database_connection.get("parsed_database_url", {}).get("dbname"),
+                self.probe_timeout_in_seconds,
+            )
+            return None
+        except Exception as err:
+
+            # The connection is dropped and re-opened by connect() at the next check.
+
+            parsed_database_url = database_connection.get("parsed_database_url", {})
+            self.log_warning(
+                "senzing-%s0706W Governor lost connection to %s database on host %s. Error: %s",
+                SENZING_PRODUCT_ID,
+                parsed_database_url.get("dbname"),
+                parsed_database_url.get("host"),
+                err,
+            )
+            await self.disconnect_database_async(database_connection)
+            self.record_failure(database_connection)
+            return None
+        if reading is None:
+            return None
+        oid_name, watermark = reading
+        self.record_reading(database_connection, oid_name, watermark, time.perf_counter() - start_time)
+        if self.vacuum_advisor is not None:
+            try:
+                if self.vacuum_advisor.is_vacuuming(database_connection):
+                    await self.vacuum_advisor.poll_progress_async(
+                        database_connection, database_connection.get("cursor")
+                    )
+                self.vacuum_advisor.observe(database_connection, None, watermark)
+            except Exception as err:
+                self.log_warning(
+                    "senzing-%s0711W Governor vacuum advisory failed on %s database. Error: %s",
+                    SENZING_PRODUCT_ID,
+                    database_connection.get("parsed_database_url", {}).get("dbname"),
+                    err,
+                )
+        return database_connection, oid_name, watermark
+
+    async def probe_databases_async(self):
+        """
+        Query every database concurrently.  Databases that cannot be reached, or time out,
+        are handled by SENZING_GOVERNOR_UNREACHABLE_POLICY, as in Governor.
+        """
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        database_connections = list(self.database_connections.values())
+        results = await asyncio.gather(
+            *[self.probe_database_async(database_connection) for database_connection in database_connections]
+        )
+        return self.apply_unreachable_policy(database_connections, results)
+
+    async def check_databases_async(self):
+        """Same as Governor.check_databases(), awaited."""
+
+        # Databases added by a reloaded configuration, and those whose connection was lost, are connected
+        # in the background.  Until then, they are left to the unreachable policy.
+
+        for database_connection in self.reload_config_if_changed():
+            await self.disconnect_database_async(database_connection)
+        self.schedule_connects()
+        if not self.profiling:
+            return self.evaluate_readings(await self.probe_databases_async())
+
+        start_time = time.perf_counter()
+        readings = await self.probe_databases_async()
+        probe_time = time.perf_counter()
+        result = self.evaluate_readings(readings)
+        self.add_profile_phase("probe", probe_time - start_time)
+        self.add_profile_phase("evaluate", time.perf_counter() - probe_time)
+        return result
+
+    # -------------------------------------------------------------------------
+    # Background sampler.
+    # -------------------------------------------------------------------------
+
+    def start_sampler(self):
+        """The sampler task is started by connect(), or the first govern(), once an event loop is running."""
+
+        self.background_sampler = True
+
+    def start_sampler_task(self):
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        if self.background_sampler and self.sampler_task is None:
+            self.sampler_task = asyncio.create_task(self.run_sampler_async())
+
+    async def run_sampler_async(self):
+        """Same as Governor.run_sampler(), as a task on the event loop."""
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        await self.connect()
+        while True:
+            try:
+                if self.profiling:
+                    self.publish_snapshot(await self.profile_call_async(self.check_databases_async))
+                else:
+                    self.publish_snapshot(await self.check_databases_async())
+            except Exception as err:
+                logger.warning(
+                    "senzing-{0}0702W Governor background sampler failed to check databases. Error: {1}".format(
+                        SENZING_PRODUCT_ID, err
+                    )
+                )
+            self.flush_log()
+            await asyncio.sleep(self.current_check_interval_in_seconds)
+
+    # -------------------------------------------------------------------------
+    # Support for Python asynchronous Context Manager.
+    # -------------------------------------------------------------------------
+
+    def __enter__(self):
+        raise TypeError("AsyncGovernor must be used with 'async with'.")
+
+    def __exit__(self, type, value, traceback):
+        """Never called, as __enter__() refuses."""
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.close()
+
+    # -------------------------------------------------------------------------
+    # Public API methods.
+    #  - govern()
+    #  - throttle()
+    #  - close()
+    # -------------------------------------------------------------------------
+
+    async def govern(self, *args, count=1, database=None, **kwargs):
+        """
+        Same as Governor.govern(), but databases are checked without blocking the event loop.
+        Returns the suggested wait time; the caller decides how to wait.
+        """
+
+        if self.wrap_govern:
+            return await self.govern_wrapped_async(*args, count=count, database=database, **kwargs)
+        return await self.govern_unwrapped_async(count=count, database=database)
+
+    async def govern_wrapped_async(self, *args, **kwargs):
+        """Same as Governor.govern_wrapped(), awaited."""
+
+        if self.profiling:
+            return await self.profile_call_async(self.govern_tokens_async, *args, **kwargs)
+        return await self.govern_tokens_async(*args, **kwargs)
+
+    async def govern_unwrapped_async(self, *args, count=1, database=None, **kwargs):
+        """Same as Governor.govern_unwrapped(), awaited."""
+
+        if count != 1 or database is not None:
+            return await self.govern_many(count, database=database)
+
+        ticket = next(self.tickets)
+
+        if self.subscriber:
+            snapshot = self.read_shared_snapshot()
+            if snapshot is not None:
+                return snapshot.wait_time
+
+        if self.sampler_task is None and self.background_sampler and not self.subscriber:
+            self.start_sampler_task()
+        if self.sampler_task is not None:
+            return self.snapshot.wait_time
+
+        return await self.check_if_due(ticket % self.current_interval == 0)
+
+    async def govern_many(self, count, *args, database=None, **kwargs):
+        """Same as Governor.govern_many(), awaited."""
+
+        if count <= 0:
+            return WaitTime(0.0)
+        if self.sampler_task is None and self.background_sampler and not self.subscriber:
+            self.start_sampler_task()
+        snapshot = self.read_shared_snapshot() if self.subscriber else None
+        if snapshot is not None:
+            wait_time = snapshot.wait_time
+        elif self.sampler_task is not None:
+            wait_time = self.snapshot.wait_time
+        else:
+            wait_time = await self.check_if_due(self.count_batch(count))
+        return self.scale_wait_time(wait_time, count, database)
+
+    async def check_if_due(self, crossed_interval):
+        """
+        Only make expensive checks after "interval" records have been read,
+        or the check time has passed and no other coroutine is already checking.
+        """
+
+        if not crossed_interval:
+            if self.clock() <= self.next_check_time or self.check_lock.locked():
+                return self.old_wait_time
+
+        if self.profiling:
+            start_time = time.perf_counter()
+            await self.check_lock.acquire()
+            self.add_profile_phase("lock", time.perf_counter() - start_time)
+        else:
+            await self.check_lock.acquire()
+        try:
+            if not crossed_interval and self.clock() <= self.next_check_time:
+                return self.old_wait_time
+            self.next_check_time = self.clock() + self.check_time_interval_in_seconds
+            self.publish_snapshot(await self.check_databases_async())
+            return self.snapshot.wait_time
+        finally:
+            self.check_lock.release()
+            self.flush_log()
+
+    async def throttle(self, *args, **kwargs):
+        """
+        Call govern() and sleep for the suggested time.
+        When the system is in trouble (-1.0), sleep for one check interval so the caller
+        is not spun in a tight loop.  Returns what govern() returned.
+        """
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        wait_time = await self.govern(*args, **kwargs)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        elif wait_time < 0:
+            await asyncio.sleep(self.current_check_interval_in_seconds)
+        return wait_time
+
+    async def close(self, *args, **kwargs):
+        """Tasks to perform when shutting down, e.g., close DB connections"""
+
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        self.stop_server()
+        self.stop_metrics_server()
+        if self.vacuum_advisor is not None:
+            self.vacuum_advisor.close()
+        if self.sampler_task is not None:
+            self.sampler_task.cancel()
+            try:
+                await self.sampler_task
+            except asyncio.CancelledError:
+                pass
+            self.sampler_task = None
+        for database_connection in self.monitored_database_connections.values():
+            await self.disconnect_database_async(database_connection)
+        if self.shared_snapshot is not None:
+            self.shared_snapshot.close()
+            self.shared_snapshot = None
+        self.flush_log()
+        logger.info("senzing-{0}0007I Governor closed.".format(SENZING_PRODUCT_ID))
+
+    # -------------------------------------------------------------------------
+    # Profiling.
+    # -------------------------------------------------------------------------
+
+    async def profile_call_async(self, function, *args, **kwargs):
+        """Await function, recording its total time and the phases it reports."""
+
+        timestamp = time.time()
+        token = profile_phases.set({})
+        try:
+            start_time = time.perf_counter()
+            result = await function(*args, **kwargs)
+            total = time.perf_counter() - start_time
+            self.record_profile(timestamp, total, profile_phases.get())
+        finally:
+            profile_phases.reset(token)
+        return result
+
+    # -------------------------------------------------------------------------
+    # Token bucket rate shaping.
+    # -------------------------------------------------------------------------
+
+    async def govern_tokens_async(self, *args, count=1, cost=None, hint=None, **kwargs):
+        """Same as Governor.govern_tokens(), awaited."""
+
+        wait_time = await self.govern_unwrapped_async(*args, count=count, **kwargs)
+        if wait_time < 0 or self.token_shaper is None:
+            return wait_time
+        return self.token_shaper.take(count if cost is None else cost, hint or self.hint, self.clock())
+
+
+# -----------------------------------------------------------------------------
+# Class: RemoteGovernor
+# -----------------------------------------------------------------------------
+
+
+class RemoteGovernor:
+    """
+    A client of a Governor serving wait times (SENZING_GOVERNOR_SERVER_ADDRESS), for example
+    senzing_governor.py running as a service.  It has the same govern() and close() as Governor,
+    but never connects to a database, so a fleet of loaders causes one set of probes in total.
+
+    Answers are cached for cache_ttl_in_seconds, then refreshed in the background while the cached answer is used.
+    When the service does not answer within timeout_in_seconds, the last answer is used until its reading is
+    max_staleness_in_seconds old.  After that, unreachable_policy decides: "fail-open" returns 0.0 and "fail-closed"
+    returns -1.0.  The service is asked again after reconnect_min_delay_in_seconds, backing off exponentially up to
+    reconnect_max_delay_in_seconds, so only the first caller ever waits for an answer.
+
+    Example:
+
+        with RemoteGovernor("udp://governor-host:8256") as governor:
+            time.sleep(max(governor.govern(), 0))
+    """
+
+    def __init__(
+        self,
+        address=None,
+        cache_ttl_in_seconds=1.0,
+        max_staleness_in_seconds=30,
+        timeout_in_seconds=0.1,
+        unreachable_policy="fail-open",
+        clock=None,
+        reconnect_min_delay_in_seconds=1,
+        reconnect_max_delay_in_seconds=60,
+        *args,
+        **kwargs,
+    ):
+        self.address = os.getenv("SENZING_GOVERNOR_SERVER_ADDRESS", address)
+        self.cache_ttl_in_seconds = float(os.getenv("SENZING_GOVERNOR_CACHE_TTL_IN_SECONDS", cache_ttl_in_seconds))
+        self.max_staleness_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_MAX_STALENESS_IN_SECONDS", max_staleness_in_seconds)
+        )
+        self.timeout_in_seconds = float(os.getenv("SENZING_GOVERNOR_REMOTE_TIMEOUT_IN_SECONDS", timeout_in_seconds))
+        self.unreachable_policy = os.getenv("SENZING_GOVERNOR_UNREACHABLE_POLICY", unreachable_policy).lower()
+        self.reconnect_min_delay_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_RECONNECT_MIN_DELAY_IN_SECONDS", reconnect_min_delay_in_seconds)
+        )
+        self.reconnect_max_delay_in_seconds = float(
+            os.getenv("SENZING_GOVERNOR_RECONNECT_MAX_DELAY_IN_SECONDS", reconnect_max_delay_in_seconds)
+        )
+        self.clock = clock or time.time
+        self.family, self.server_address = parse_server_address(self.address)
+        self.socket = None
+        self.lock = threading.Lock()
+        self.request_ids = itertools.count(1)
+        self.unreachable = False
+        self.failures = 0
+        self.next_request_time = 0.0
+        self.refresh_executor = None
+        self.refresh_futures = {}
+
+        # Per database (None for all of them):
+        # (WaitTime, time fetched, time the databases were checked, longest wait of a batch).
+
+        self.cache = {}
+        self.refresh_counts = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def govern(self, *args, count=1, database=None, **kwargs):
+        """Same as Governor.govern(), answered from the cache or the service."""
+
+        now = self.clock()
+        cached = self.cache.get(database)
+        if now < self.next_request_time:
+            pass  # Backing off from an unreachable service.
+        elif cached is None:
+            cached = self.refresh(database, now)
+        elif (now - cached[1]) > self.cache_ttl_in_seconds:
+            self.schedule_refresh(database, now)
+        if cached is None or (now - cached[2]) > self.max_staleness_in_seconds:
+            return WaitTime(-1.0 if self.unreachable_policy == "fail-closed" else 0.0)
+        wait_time = cached[0]
+        if wait_time < 0 or count == 1:
+            return wait_time
+        return WaitTime(min(wait_time * count, cached[3]), wait_time.database)
+
+    def govern_many(self, count, *args, database=None, **kwargs):
+        if count <= 0:
+            return WaitTime(0.0)
+        return self.govern(count=count, database=database)
+
+    def schedule_refresh(self, database, now):
+        """Ask the refresher thread for a new answer, unless it is already asking for this database."""
+
+        import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+        future = self.refresh_futures.get(database)
+        if future is not None and not future.done():
+            return
+        if self.refresh_executor is None:
+            self.refresh_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="senzing-governor-refresh"
+            )
+        self.refresh_futures[database] = self.refresh_executor.submit(self.refresh, database, now)
+
+    def refresh(self, database, now):
+        """
+        Ask the service for a new answer and cache it.  Only one thread asks at a time;
+        when nothing is cached yet, the others wait for that answer.
+        Returns the new cache entry, or None.
+        """
+
+        refresh_count = self.refresh_counts.get(database, 0)
+        with self.lock:
+            if self.refresh_counts.get(database, 0) != refresh_count:
+                return self.cache.get(database)  # Answered, or not, while this thread waited.
+            try:
+                request_id = next(self.request_ids)
+                response = self.request({"id": request_id, "database": database}, request_id)
+                result = (
+                    WaitTime(response["wait_time"], response.get("database")),
+                    now,
+                    now - float(response.get("age", 0.0)),
+                    float(response.get("max_batch_wait", "inf")),
+                )
+            except (OSError, ValueError, KeyError, TypeError) as err:
+                self.record_failure(err)
+                return None
+            finally:
+                self.refresh_counts[database] = refresh_count + 1  # Threads that waited for this answer use it.
+            self.cache[database] = result
+        self.failures = 0
+        if self.unreachable:
+            logger.info("senzing-{0}0022I RemoteGovernor reached {1} again.".format(SENZING_PRODUCT_ID, self.address))
+            self.unreachable = False
+        return result
+
+    def record_failure(self, err):
+        """Back off exponentially, up to reconnect_max_delay_in_seconds, before asking the service again."""
+
+        self.failures += 1
+        delay = min(self.reconnect_max_delay_in_seconds, self.reconnect_min_delay_in_seconds * 2 ** (self.failures - 1))
+        self.next_request_time = self.clock() + delay
+        if not self.unreachable:
+            logger.warning(
+                "senzing-{0}0716W RemoteGovernor could not get a wait time from {1}. Retrying in {2} seconds. Error: {3}".format(
+                    SENZING_PRODUCT_ID, self.address, delay, err
+                )
+            )
+            self.unreachable = True
+
+    def request(self, request, request_id):
+        """Send one request and wait, up to timeout_in_seconds, for its response.  The caller holds self.lock."""
+
+        import socket  # pylint: disable=import-outside-toplevel
+
+        if self.socket is None:
+            self.socket = socket.socket(self.family, socket.SOCK_DGRAM)
+            if self.family == socket.AF_UNIX:
+                self.socket.bind("")  # An automatic abstract address, so the service can answer.
+        self.socket.settimeout(self.timeout_in_seconds)
+        self.socket.sendto(json.dumps(request).encode("utf-8"), self.server_address)
+
+        # Skip late answers to earlier requests that timed out.
+
+        while True:
+            response = json.loads(self.socket.recv(65536))
+            if isinstance(response, dict) and response.get("id") == request_id:
+                return response
+
+    def close(self, *args, **kwargs):
+        if self.refresh_executor is not None:
+            self.refresh_executor.shutdown(wait=False, cancel_futures=True)
+            self.refresh_executor = None
+        with self.lock:
+            if self.socket is not None:
+                self.socket.close()
+                self.socket = None
 
 
 if __name__ == "__main__":
@@ -469,12 +3943,28 @@ if __name__ == "__main__":
     log_level = log_level_map.get(log_level_parameter, logging.INFO)
     logging.basicConfig(format=log_format, level=log_level)
 
-    # Create governor.
+    # Create governor.  As a service, it checks the databases in the background and serves the
+    # wait time to RemoteGovernors at SENZING_GOVERNOR_SERVER_ADDRESS ("" turns that off).
 
-    governor = Governor()
+    governor = Governor(background_sampler=True, server_address="udp://127.0.0.1:8256")
+    governor.load_database_connections()
+    governor.flush_log()
 
     # Print databases specified by environment variables.
 
-    sql_connection_strings = governor.database_urls.split(governor.list_separator)
+    sql_connection_strings = (governor.database_urls or "").split(governor.list_separator)
     for sql_connection_string in sql_connection_strings:
-        logging.info("senzing-{0}0008I Database: {1}".format(SENZING_PRODUCT_ID, sql_connection_string))
+        logger.info("senzing-{0}0008I Database: {1}".format(SENZING_PRODUCT_ID, sql_connection_string))
+
+    # Keep running until signaled.  SIGHUP re-reads SENZING_GOVERNOR_CONFIG_FILE.
+
+    import signal  # pylint: disable=import-outside-toplevel
+
+    shutdown_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: shutdown_event.set())
+    signal.signal(signal.SIGTERM, lambda signum, frame: shutdown_event.set())
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda signum, frame: governor.reload_config())
+    shutdown_event.wait()
+
+    governor.close()